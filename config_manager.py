@@ -14,6 +14,27 @@ if not CONFIG_PATH.parent.exists():
     CONFIG_PATH = Path.home() / ".filmbot" / "config.json"
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+# Schedules store day_of_week as an index into this tuple (0 = Sunday)
+DAY_NAMES = ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+
+# Full names and 3-letter abbreviations -> day index
+_DAY_INDEX = {name: i for i, name in enumerate(DAY_NAMES)}
+_DAY_INDEX.update({name[:3]: i for i, name in enumerate(DAY_NAMES)})
+
+
+def day_index(day_of_week) -> int:
+    """Convert a day of week to its stored index.
+
+    Args:
+        day_of_week: Day index (0-6, 0 = Sunday) or name (e.g., 'sunday', 'sun')
+
+    Returns:
+        Day index, defaulting to 0 (Sunday) for unknown names
+    """
+    if isinstance(day_of_week, int):
+        return day_of_week % 7
+    return _DAY_INDEX.get(day_of_week.lower(), 0)
+
 
 class ConfigManager:
     """Manages Filmbot configuration file."""
@@ -85,6 +106,9 @@ class ConfigManager:
                 self._config = json.load(f)
             # Ensure all required keys exist with deep merge
             self._deep_merge_defaults(self._config, self.DEFAULT_CONFIG)
+            # Older configs stored day names instead of indexes
+            for schedule in self._config["schedules"]:
+                schedule["day_of_week"] = day_index(schedule["day_of_week"])
             return self._config
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading config: {e}")
@@ -133,11 +157,11 @@ class ConfigManager:
         """Get recording schedules."""
         return self._config.get("schedules", [])
     
-    def add_schedule(self, day_of_week: str, start_time: str, duration_minutes: int) -> str:
+    def add_schedule(self, day_of_week, start_time: str, duration_minutes: int) -> str:
         """Add a new recording schedule.
 
         Args:
-            day_of_week: Day name (e.g., 'sunday', 'monday')
+            day_of_week: Day index (0-6, 0 = Sunday) or name (e.g., 'sunday', 'monday')
             start_time: Start time in HH:MM format
             duration_minutes: Duration in minutes
 
@@ -159,7 +183,7 @@ class ConfigManager:
         
         schedule = {
             "id": schedule_id,
-            "day_of_week": day_of_week.lower(),
+            "day_of_week": day_index(day_of_week),
             "start_time": start_time,
             "duration_minutes": duration_minutes,
             "enabled": True
@@ -172,6 +196,8 @@ class ConfigManager:
     
     def update_schedule(self, schedule_id: str, **kwargs):
         """Update an existing schedule."""
+        if "day_of_week" in kwargs:
+            kwargs["day_of_week"] = day_index(kwargs["day_of_week"])
         schedules = self.get_schedules()
         for schedule in schedules:
             if schedule["id"] == schedule_id:
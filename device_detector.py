@@ -6,15 +6,63 @@ Detects available video and audio devices.
 import subprocess
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+ALSA_CARDS_PATH = Path("/proc/asound/cards")
 
-def detect_video_devices() -> List[Tuple[str, str]]:
+# Last detection results, with the hotplug key they were detected under
+_video_cache: Tuple[Optional[tuple], Optional[List[Tuple[str, str]]]] = (None, None)
+_audio_cache: Tuple[Optional[str], Optional[List[Tuple[str, str]]]] = (None, None)
+
+
+def _video_nodes_key() -> tuple:
+    """Identify the current set of /dev/video* nodes.
+
+    udev recreates a node when its device is plugged in, so the inode and
+    ctime change on every hotplug even if the name is reused.
+
+    Returns:
+        Tuple of (name, inode, ctime) for each video node
+    """
+    key = []
+    for device_path in sorted(Path("/dev").glob("video*")):
+        try:
+            st = device_path.stat()
+        except OSError:
+            continue
+        key.append((device_path.name, st.st_ino, st.st_ctime_ns))
+    return tuple(key)
+
+
+def _audio_cards_key() -> str:
+    """Identify the current set of ALSA sound cards.
+
+    Returns:
+        Contents of /proc/asound/cards, or '' if it can't be read
+    """
+    try:
+        return ALSA_CARDS_PATH.read_text()
+    except OSError:
+        return ""
+
+
+def detect_video_devices(refresh: bool = False) -> List[Tuple[str, str]]:
     """Detect available V4L2 video capture devices.
 
+    The result is cached until a video device is added or removed.
+
+    Args:
+        refresh: Probe the devices again even if nothing was hotplugged
+
     Returns:
-        List of (device_path, device_name) tuples
+        List of (device_path, device_name) tuples (shared; don't modify)
     """
+    global _video_cache
+
+    key = _video_nodes_key()
+    if not refresh and _video_cache[0] == key:
+        return _video_cache[1]
+
     devices = []
 
     # Devices to exclude (Raspberry Pi internal encoders/decoders/ISP)
@@ -28,9 +76,8 @@ def detect_video_devices() -> List[Tuple[str, str]]:
     ]
 
     # Check /dev/video* devices
-    video_devices = sorted(Path("/dev").glob("video*"))
-
-    for device_path in video_devices:
+    for name, _, _ in key:
+        device_path = Path("/dev") / name
         try:
             # Use v4l2-ctl to get device info and capabilities
             result = subprocess.run(
@@ -65,15 +112,27 @@ def detect_video_devices() -> List[Tuple[str, str]]:
     if not devices:
         devices.append(("/dev/video5", "Default Video Device (not detected)"))
 
+    _video_cache = (key, devices)
     return devices
 
 
-def detect_audio_devices() -> List[Tuple[str, str]]:
+def detect_audio_devices(refresh: bool = False) -> List[Tuple[str, str]]:
     """Detect available ALSA audio capture devices.
-    
+
+    The result is cached until a sound card is added or removed.
+
+    Args:
+        refresh: Run arecord again even if nothing was hotplugged
+
     Returns:
-        List of (device_id, device_name) tuples
+        List of (device_id, device_name) tuples (shared; don't modify)
     """
+    global _audio_cache
+
+    key = _audio_cards_key()
+    if not refresh and _audio_cache[0] == key:
+        return _audio_cache[1]
+
     devices = []
     
     try:
@@ -106,7 +165,8 @@ def detect_audio_devices() -> List[Tuple[str, str]]:
     # Fallback if no devices found
     if not devices:
         devices.append(("hw:2,0", "Default Audio Device (not detected)"))
-    
+
+    _audio_cache = (key, devices)
     return devices
 
 
@@ -139,7 +199,7 @@ def get_device_info(video_device: str, audio_device: str) -> str:
                 info_lines.append(f"Video: {video_device}")
         else:
             info_lines.append(f"Video: {video_device}")
-    except:
+    except (subprocess.TimeoutExpired, FileNotFoundError):
         info_lines.append(f"Video: {video_device}")
     
     # Audio device info
@@ -10,6 +10,7 @@ from email.message import EmailMessage
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
+from PySide6.QtCore import QObject, QRunnable, Signal
 from config_manager import ConfigManager
 
 
@@ -191,3 +192,39 @@ Status: {status_emoji} {status}
         
         return self.send_email(subject, body, priority="info")
 
+
+class _SendEmailSignals(QObject):
+    """Signals emitted by SendEmailTask."""
+
+    done = Signal(bool, str)
+
+
+class SendEmailTask(QRunnable):
+    """Sends an email on the thread pool so SMTP doesn't block the UI."""
+
+    def __init__(self, subject: str, body: str, priority: str):
+        """Initialize send task.
+
+        Args:
+            subject: Email subject
+            body: Email body (plain text)
+            priority: Alert priority ('critical', 'warning', 'info')
+        """
+        super().__init__()
+        self.subject = subject
+        self.body = body
+        self.priority = priority
+        self.signals = _SendEmailSignals()
+
+    def run(self):
+        """Send the email and report (success, error message)."""
+        try:
+            notifier = EmailNotifier()
+            success = notifier.send_email(
+                subject=self.subject,
+                body=self.body,
+                priority=self.priority
+            )
+            self.signals.done.emit(success, "")
+        except Exception as e:
+            self.signals.done.emit(False, str(e))
@@ -0,0 +1,117 @@
+#!/bin/bash
+# Filmbot recording unit helper
+# Installed root-owned as /usr/local/sbin/filmbot-units and run by the UI
+# through sudo. It only ever touches
+# /etc/systemd/system/filmbot-record-<id>.{service,timer}, and it writes the
+# unit contents itself from validated fields - nothing the caller passes ends
+# up in a unit file unchecked.
+#
+# Usage:
+#   filmbot-units write ID DAY HH:MM SECONDS [ID DAY HH:MM SECONDS ...]
+#   filmbot-units remove ID [ID ...]
+#   filmbot-units enable ID [ID ...]     (systemctl enable --now the timers)
+#   filmbot-units disable ID [ID ...]    (systemctl disable --now the timers)
+#
+# DAY is a systemd weekday (Mon..Sun); SECONDS is the recording duration.
+# Keep the unit text in sync with SystemdManager's templates, which the UI
+# uses to skip rewriting unchanged units.
+
+set -euo pipefail
+
+UNIT_DIR="/etc/systemd/system"
+
+die() {
+    echo "filmbot-units: $*" >&2
+    exit 2
+}
+
+check_id() {
+    [[ "$1" =~ ^[a-z0-9][a-z0-9-]{0,63}$ ]] || die "invalid schedule id: $1"
+}
+
+write_service() {
+    local id="$1" seconds="$2"
+    cat <<EOF
+[Unit]
+Description=Filmbot Recording $id
+After=network.target
+
+[Service]
+Type=oneshot
+User=filmbot
+ExecStart=/opt/filmbot-appliance/record-atem.sh $seconds
+StandardOutput=journal
+StandardError=journal
+
+[Install]
+WantedBy=multi-user.target
+EOF
+}
+
+write_timer() {
+    local id="$1" day="$2" time="$3"
+    cat <<EOF
+[Unit]
+Description=Filmbot Recording Timer $id
+
+[Timer]
+OnCalendar=$day $time
+Persistent=true
+
+[Install]
+WantedBy=timers.target
+EOF
+}
+
+# Write one unit atomically with mode 644
+install_unit() {
+    local name="$1" tmp
+    tmp=$(mktemp "$UNIT_DIR/.filmbot-units.XXXXXX")
+    cat > "$tmp"
+    chmod 644 "$tmp"
+    mv -f "$tmp" "$UNIT_DIR/$name"
+}
+
+cmd="${1:-}"
+[ $# -ge 2 ] || die "usage: filmbot-units write|remove|enable|disable ID ..."
+shift
+
+case "$cmd" in
+    write)
+        [ $(( $# % 4 )) -eq 0 ] || die "write takes ID DAY HH:MM SECONDS groups"
+
+        # Validate everything before writing anything
+        args=("$@")
+        for (( i = 0; i < $#; i += 4 )); do
+            check_id "${args[i]}"
+            [[ "${args[i+1]}" =~ ^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)$ ]] || die "invalid day: ${args[i+1]}"
+            [[ "${args[i+2]}" =~ ^([01][0-9]|2[0-3]):[0-5][0-9]$ ]] || die "invalid time: ${args[i+2]}"
+            [[ "${args[i+3]}" =~ ^[1-9][0-9]{0,5}$ ]] || die "invalid duration: ${args[i+3]}"
+        done
+
+        for (( i = 0; i < $#; i += 4 )); do
+            id="${args[i]}"
+            write_service "$id" "${args[i+3]}" | install_unit "filmbot-record-$id.service"
+            write_timer "$id" "${args[i+1]}" "${args[i+2]}" | install_unit "filmbot-record-$id.timer"
+        done
+        ;;
+    remove)
+        for id in "$@"; do
+            check_id "$id"
+        done
+        for id in "$@"; do
+            rm -f "$UNIT_DIR/filmbot-record-$id.service" "$UNIT_DIR/filmbot-record-$id.timer"
+        done
+        ;;
+    enable|disable)
+        timers=()
+        for id in "$@"; do
+            check_id "$id"
+            timers+=("filmbot-record-$id.timer")
+        done
+        systemctl "$cmd" --now "${timers[@]}"
+        ;;
+    *)
+        die "unknown command: $cmd"
+        ;;
+esac
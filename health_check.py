@@ -211,7 +211,7 @@ class HealthChecker:
                     details['Temperature'] = f'{temp_c:.1f}°C (HIGH)'
                 else:
                     details['Temperature'] = f'{temp_c:.1f}°C'
-        except:
+        except (OSError, ValueError):
             pass
         
         return status, details
@@ -233,7 +233,7 @@ class HealthChecker:
                 uptime_str = f"{hours} hours"
 
             return {'Uptime': uptime_str}
-        except:
+        except (OSError, ValueError, IndexError):
             return {'Uptime': 'Unknown'}
 
     def run_health_check(self) -> Dict:
@@ -89,6 +89,10 @@ sudo chmod +x /opt/filmbot-appliance/record-atem.sh
 sudo chmod +x /opt/filmbot-appliance/sync-drive.sh
 sudo chown filmbot:filmbot /opt/filmbot-appliance/*.sh
 
+# Root-owned helper that writes/removes the recording timer units; the UI
+# may only change /etc/systemd/system through it
+sudo install -o root -g root -m 755 "$SCRIPT_DIR"/filmbot-units.sh /usr/local/sbin/filmbot-units
+
 # Create virtual environment
 echo "Creating Python virtual environment..."
 cd /opt/filmbot-appliance/ui
@@ -110,11 +114,7 @@ sudo systemctl daemon-reload
 echo "Configuring sudo permissions..."
 sudo tee /etc/sudoers.d/filmbot > /dev/null <<EOF
 filmbot ALL=(ALL) NOPASSWD: /bin/systemctl daemon-reload
-filmbot ALL=(ALL) NOPASSWD: /bin/systemctl enable filmbot-record-*.timer
-filmbot ALL=(ALL) NOPASSWD: /bin/systemctl disable filmbot-record-*.timer
-filmbot ALL=(ALL) NOPASSWD: /bin/systemctl start filmbot-record-*.timer
-filmbot ALL=(ALL) NOPASSWD: /bin/systemctl stop filmbot-record-*.timer
-filmbot ALL=(ALL) NOPASSWD: /bin/systemctl is-active filmbot-record-*.service
+filmbot ALL=(root) NOPASSWD: /usr/local/sbin/filmbot-units
 EOF
 
 sudo chmod 0440 /etc/sudoers.d/filmbot
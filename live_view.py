@@ -16,7 +16,7 @@ from PySide6.QtGui import QFont
 
 from video_preview import VideoPreviewWidget
 from recording_screen import RecordingScreen
-from config_manager import ConfigManager
+from config_manager import ConfigManager, DAY_NAMES
 
 
 class LiveView(QWidget):
@@ -254,7 +254,7 @@ class LiveView(QWidget):
                     with open(self.signal_file, 'r') as f:
                         filename = Path(f.read().strip()).name
                         self.recording_widget.set_filename(filename)
-                except:
+                except OSError:
                     pass
         else:
             # Recording is not active - switch to live view
@@ -305,7 +305,7 @@ class LiveView(QWidget):
         # For now, just show the first enabled schedule
         for schedule in schedules:
             if schedule.get('enabled', True):
-                day = schedule['day_of_week'].capitalize()
+                day = DAY_NAMES[schedule['day_of_week']].capitalize()
                 time = schedule['start_time']
                 duration = schedule['duration_minutes']
                 self.next_recording_label.setText(
@@ -441,5 +441,6 @@ class LiveView(QWidget):
         self.update_timer.stop()
         self.audio_timer.stop()
         self.stop_audio_monitoring()
+        self.video_widget.stop_preview()
         super().closeEvent(event)
 
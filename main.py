@@ -13,6 +13,7 @@ from config_manager import ConfigManager
 from wizard import SetupWizard
 from live_view import LiveView
 from settings import SettingsScreen
+from rclone_rc import stop_rclone_daemon
 
 
 class FilmbotApp(QMainWindow):
@@ -82,6 +83,16 @@ class FilmbotApp(QMainWindow):
         self.settings.load_settings()
         self.stack.setCurrentWidget(self.settings)
 
+    def closeEvent(self, event):
+        """Stop background processes and devices before closing.
+
+        Also runs before an in-place restart (os.execv), which would otherwise
+        leave the rclone daemon and the capture device held by the old image.
+        """
+        self.live_view.close()
+        stop_rclone_daemon()
+        super().closeEvent(event)
+
 
 def main():
     """Main entry point."""
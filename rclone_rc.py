@@ -0,0 +1,273 @@
+"""
+rclone remote control client for Filmbot appliance.
+Keeps a single `rclone rcd` daemon running so Drive listings reuse its
+OAuth token and connection instead of starting rclone for every request.
+"""
+
+import base64
+import json
+import re
+import secrets
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import (
+    QObject, QProcess, QProcessEnvironment, QTimer, QUrl, QCoreApplication
+)
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+RC_ADDR = "127.0.0.1:5572"
+RC_TIMEOUT_MS = 10000
+RCLONE_TIMEOUT_MS = 10000  # one-off rclone processes (e.g. lsd) are killed after this
+
+# rclone lsd line: "          -1 2024-01-01 12:00:00        -1 FolderName"
+_LSD_RE = re.compile(rb'^\s*-?\d+\s+\S+\s+\S+\s+-?\d+\s+(.+?)\s*$')
+
+# Called with (folder_names, error_message); folder_names is None on error
+ListCallback = Callable[[Optional[List[str]], str], None]
+
+
+class RcloneDaemon(QObject):
+    """Manages an `rclone rcd` process and talks to it over HTTP."""
+
+    def __init__(self, parent=None):
+        """Initialize rclone daemon client.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+
+        self.process = None
+        self.ready = False
+
+        # Random credentials so other local users can't drive the daemon
+        self._user = "filmbot"
+        self._password = secrets.token_urlsafe(16)
+        token = base64.b64encode(f"{self._user}:{self._password}".encode()).decode()
+        self._auth_header = f"Basic {token}".encode()
+
+        self._network = QNetworkAccessManager(self)
+
+    def start(self):
+        """Start the daemon if it isn't already running."""
+        if self.process is not None:
+            return
+
+        self.ready = False
+        self.process = QProcess(self)
+        self.process.readyReadStandardError.connect(self._on_log_output)
+        self.process.finished.connect(self._on_finished)
+        self.process.errorOccurred.connect(self._on_error)
+
+        # Credentials go in the environment, not argv, so they don't show up
+        # in ps or /proc/<pid>/cmdline for other local users
+        env = QProcessEnvironment.systemEnvironment()
+        env.insert('RCLONE_RC_USER', self._user)
+        env.insert('RCLONE_RC_PASS', self._password)
+        self.process.setProcessEnvironment(env)
+
+        self.process.start('rclone', ['rcd', '--rc-addr', RC_ADDR])
+
+    def stop(self):
+        """Stop the daemon."""
+        if self.process is None:
+            return
+
+        process = self.process
+        self.process = None
+        self.ready = False
+        process.terminate()
+        if not process.waitForFinished(2000):
+            process.kill()
+            process.waitForFinished(1000)
+        process.deleteLater()
+
+    def _on_log_output(self):
+        """Watch the daemon log for the line saying it is serving requests."""
+        if self.process is None:
+            return
+
+        output = self.process.readAllStandardError().data()
+        if b"Serving remote control" in output:
+            self.ready = True
+
+    def _on_finished(self, exit_code, exit_status):
+        """Handle the daemon exiting (e.g. address already in use)."""
+        # stop() clears self.process first, so an intentional stop ends here
+        if self.process is None:
+            return
+
+        print(f"rclone rcd exited with code {exit_code}")
+        self.process.deleteLater()
+        self.process = None
+        self.ready = False
+
+    def _on_error(self, error):
+        """Handle the daemon failing to start."""
+        if error != QProcess.FailedToStart or self.process is None:
+            return
+
+        print(f"rclone rcd failed to start: {self.process.errorString()}")
+        self.process.deleteLater()
+        self.process = None
+        self.ready = False
+
+    def list_dirs(self, fs: str, remote: str, callback: ListCallback):
+        """List directories in a remote path.
+
+        Args:
+            fs: rclone remote (e.g., 'filmbot-drive:')
+            remote: Path within the remote ('' for the root)
+            callback: Called with (folder_names, error_message)
+        """
+        request = QNetworkRequest(QUrl(f"http://{RC_ADDR}/operations/list"))
+        request.setHeader(QNetworkRequest.ContentTypeHeader, "application/json")
+        request.setRawHeader(b"Authorization", self._auth_header)
+        request.setTransferTimeout(RC_TIMEOUT_MS)
+
+        body = json.dumps({"fs": fs, "remote": remote, "opt": {"dirsOnly": True}})
+        reply = self._network.post(request, body.encode())
+        reply.finished.connect(lambda: self._on_list_finished(reply, callback))
+
+    def _on_list_finished(self, reply: QNetworkReply, callback: ListCallback):
+        """Parse an operations/list reply and hand the result to the callback."""
+        reply.deleteLater()
+        data = reply.readAll().data()
+
+        try:
+            result = json.loads(data) if data else {}
+        except ValueError:
+            result = {}
+
+        if reply.error() != QNetworkReply.NoError:
+            # rclone reports failures as JSON with an "error" field
+            callback(None, result.get("error") or reply.errorString())
+            return
+
+        folders = [entry["Name"] for entry in result.get("list", []) if entry.get("IsDir")]
+        callback(folders, "")
+
+
+class _LsdListing(QObject):
+    """Lists directories with a one-off `rclone lsd` process.
+
+    Used until the daemon is ready. Deletes itself once the callback has run.
+    """
+
+    def __init__(self, path: str, callback: ListCallback, parent=None):
+        """Initialize listing.
+
+        Args:
+            path: rclone path to list (remote plus folder)
+            callback: Called with (folder_names, error_message)
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.path = path
+        self.callback = callback
+        self._folders = []
+        self._buffer = bytearray()
+        self._done = False
+
+        self.process = QProcess(self)
+        self.process.readyReadStandardOutput.connect(self._on_output)
+        self.process.finished.connect(self._on_finished)
+        self.process.errorOccurred.connect(self._on_error)
+
+        # Kill rclone if it hangs (e.g. no network)
+        timeout = QTimer(self)
+        timeout.setSingleShot(True)
+        timeout.timeout.connect(self.process.kill)
+        self.process.started.connect(lambda: timeout.start(RCLONE_TIMEOUT_MS))
+
+    def start(self):
+        """Start rclone lsd."""
+        self.process.start('rclone', ['lsd', self.path])
+
+    def _on_output(self):
+        """Parse complete lines of rclone lsd output as they arrive."""
+        self._buffer.extend(self.process.readAllStandardOutput().data())
+
+        # Keep any trailing partial line in the buffer for the next chunk
+        *lines, self._buffer = self._buffer.split(b'\n')
+        for line in lines:
+            self._parse_line(line)
+
+    def _parse_line(self, line: bytes):
+        """Parse a single line of rclone lsd output."""
+        match = _LSD_RE.match(line)
+        if match:
+            self._folders.append(match.group(1).decode('utf-8', errors='replace'))
+
+    def _on_error(self, error):
+        """Handle rclone failing to start."""
+        if error == QProcess.FailedToStart:
+            self._finish(None, self.process.errorString())
+
+    def _on_finished(self, exit_code, exit_status):
+        """Hand the folder list (or rclone's error) to the callback."""
+        if exit_status != QProcess.NormalExit or exit_code != 0:
+            stderr = self.process.readAllStandardError().data().decode('utf-8', errors='replace')
+            if exit_status != QProcess.NormalExit:
+                stderr = stderr or "rclone timed out"
+            self._finish(None, stderr)
+            return
+
+        # Flush a final line without a trailing newline
+        if self._buffer.strip():
+            self._parse_line(bytes(self._buffer))
+        self._finish(self._folders, "")
+
+    def _finish(self, folders: Optional[List[str]], error: str):
+        """Run the callback once and clean up."""
+        if self._done:
+            return
+        self._done = True
+        self.deleteLater()
+        self.callback(folders, error)
+
+
+_daemon: Optional[RcloneDaemon] = None
+
+
+def get_rclone_daemon() -> RcloneDaemon:
+    """Get the application-wide rclone daemon client.
+
+    The daemon itself is only started by RcloneDaemon.start(), and is
+    stopped when the application quits.
+
+    Returns:
+        Shared RcloneDaemon instance
+    """
+    global _daemon
+    if _daemon is None:
+        app = QCoreApplication.instance()
+        _daemon = RcloneDaemon(app)
+        app.aboutToQuit.connect(_daemon.stop)
+    return _daemon
+
+
+def stop_rclone_daemon():
+    """Stop the shared rclone daemon if one has been created."""
+    if _daemon is not None:
+        _daemon.stop()
+
+
+def list_remote_dirs(fs: str, remote: str, callback: ListCallback):
+    """List directories in a remote path without blocking the UI.
+
+    Goes through the rclone daemon once it is ready. Until then the daemon
+    is started for next time and this listing runs `rclone lsd` instead.
+
+    Args:
+        fs: rclone remote (e.g., 'filmbot-drive:')
+        remote: Path within the remote ('' for the root)
+        callback: Called with (folder_names, error_message)
+    """
+    daemon = get_rclone_daemon()
+    if daemon.ready:
+        daemon.list_dirs(fs, remote, callback)
+        return
+
+    daemon.start()
+    _LsdListing(f"{fs}{remote}", callback, daemon).start()
@@ -3,21 +3,208 @@ Settings screen for Filmbot appliance.
 Allows configuration changes after initial setup.
 """
 
+import fcntl
+import os
 import socket
-import subprocess
+import struct
 import sys
+import time
 from pathlib import Path
-from PySide6.QtCore import Qt, Signal, QTime, QTimer
+from typing import Dict, Optional, Tuple
+from PySide6.QtCore import (
+    Qt, Signal, QTime, QTimer, QSignalBlocker,
+    QObject, QRunnable, QThreadPool
+)
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QListWidget, QListWidgetItem, QMessageBox,
-    QComboBox, QSpinBox, QTimeEdit, QGroupBox, QScrollArea, QCheckBox
+    QComboBox, QSpinBox, QTimeEdit, QGroupBox, QScrollArea, QCheckBox,
+    QDialog, QGridLayout, QInputDialog
 )
 from PySide6.QtGui import QFont
 
-from config_manager import ConfigManager
+from config_manager import ConfigManager, DAY_NAMES
 from systemd_manager import SystemdManager
 from device_detector import detect_video_devices, detect_audio_devices
+from rclone_rc import list_remote_dirs
+from email_notify import SendEmailTask
+
+NVME_MOUNT = Path("/mnt/nvme")
+STORAGE_CACHE_TTL = 30  # seconds
+DRIVE_TEST_CACHE_TTL = 30  # seconds
+
+# Linux ioctl/route flag used to read an interface's IPv4 address
+SIOCGIFADDR = 0x8915
+RTF_UP = 0x0001
+TOAST_DURATION_MS = 2000
+
+# Short day labels indexed by schedule day_of_week (0 = Sunday)
+DAY_ABBREVIATIONS = tuple(name[:3].capitalize() for name in DAY_NAMES)
+
+# Shared by every settings section; set once on the scroll content so Qt
+# parses it once instead of per widget. Widgets with their own style sheet
+# still override it.
+SECTION_STYLE = """
+    QGroupBox { font-size: 13px; font-weight: bold; padding-top: 8px; }
+    QLabel, QCheckBox { font-size: 11px; }
+    QComboBox, QListWidget { font-size: 10px; }
+    QPushButton { font-size: 12px; font-weight: bold; }
+"""
+
+EMAIL_TEST_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    QPushButton:pressed {
+        background-color: #1976D2;
+    }
+"""
+
+EMAIL_SAVE_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    QPushButton:pressed {
+        background-color: #45a049;
+    }
+"""
+
+EMAIL_CANCEL_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #757575;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    QPushButton:pressed {
+        background-color: #616161;
+    }
+"""
+
+
+# Recent statvfs results: path -> (timestamp, used_gb, total_gb)
+_storage_cache: Dict[Path, Tuple[float, float, float]] = {}
+
+
+def _cached_storage_usage(path: Path) -> Optional[Tuple[float, float]]:
+    """Get storage usage for a path if it was read recently.
+
+    Args:
+        path: Path that was passed to statvfs
+
+    Returns:
+        (used_gb, total_gb), or None if there is no fresh cached value
+    """
+    cached = _storage_cache.get(path)
+    if cached is None or time.monotonic() - cached[0] >= STORAGE_CACHE_TTL:
+        return None
+    return cached[1], cached[2]
+
+
+def _default_route_ip() -> str:
+    """Get the IPv4 address of the default-route interface.
+
+    Reads /proc/net/route and asks the kernel for the interface address,
+    so no packets are sent and nothing can block on the network.
+
+    Returns:
+        IP address, or an empty string if there is no default route
+    """
+    iface = None
+    best_metric = None
+    with open("/proc/net/route") as f:
+        next(f)  # Header
+        for line in f:
+            fields = line.split()
+            # Iface Destination Gateway Flags RefCnt Use Metric ...
+            if fields[1] != "00000000" or not int(fields[3], 16) & RTF_UP:
+                continue
+            metric = int(fields[6])
+            if best_metric is None or metric < best_metric:
+                iface, best_metric = fields[0], metric
+
+    if iface is None:
+        return ""
+
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        ifreq = fcntl.ioctl(s.fileno(), SIOCGIFADDR, struct.pack('256s', iface[:15].encode()))
+    finally:
+        s.close()
+    return socket.inet_ntoa(ifreq[20:24])
+
+
+def _udp_probe_ip() -> str:
+    """Get the local IP address by connecting a UDP socket to a public host.
+
+    Returns:
+        IP address, or an empty string if not connected
+    """
+    # Timeout so a dead network can't hang the worker
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.settimeout(1.0)
+    try:
+        s.connect(("8.8.8.8", 80))
+        return s.getsockname()[0]
+    except OSError:
+        return ""
+    finally:
+        s.close()
+
+
+class _InfoProbeSignals(QObject):
+    """Signals emitted by _InfoProbe."""
+
+    ip_ready = Signal(str)
+    storage_ready = Signal(float, float)
+    storage_failed = Signal()
+
+
+class _InfoProbe(QRunnable):
+    """Looks up the IP address and storage usage off the UI thread."""
+
+    def __init__(self, storage_path: Optional[Path] = None):
+        """Initialize info probe.
+
+        Args:
+            storage_path: Path to run statvfs on, or None to skip storage
+        """
+        super().__init__()
+        self.storage_path = storage_path
+        self.signals = _InfoProbeSignals()
+
+    def run(self):
+        """Probe IP address and storage, emitting results as they arrive."""
+        # Get IP address from the routing table, falling back to a UDP probe
+        try:
+            ip = _default_route_ip()
+        except (OSError, ValueError, IndexError):
+            ip = _udp_probe_ip()
+        self.signals.ip_ready.emit(ip)
+
+        if self.storage_path is None:
+            return
+
+        try:
+            stat = os.statvfs(self.storage_path)
+        except OSError:
+            self.signals.storage_failed.emit()
+            return
+        total_gb = (stat.f_blocks * stat.f_frsize) / (1024**3)
+        used_gb = ((stat.f_blocks - stat.f_bfree) * stat.f_frsize) / (1024**3)
+        self.signals.storage_ready.emit(used_gb, total_gb)
 
 
 class SettingsScreen(QWidget):
@@ -35,11 +222,48 @@ class SettingsScreen(QWidget):
         super().__init__(parent)
         
         self.config = config
-        self.systemd_mgr = SystemdManager(dry_run=False)
+        self._systemd_mgr = None  # created on first schedule change
+
+        # Folder browser / connection test state
+        self._browse_busy = False
+        self._test_busy = False
+        self._browse_folder = ""
+
+        # (remote, folder, monotonic time) of the last successful test, and
+        # the (remote, folder) of the test in flight
+        self._last_test_ok = (None, None, float('-inf'))
+        self._test_target = None
+
+        # Storage path is resolved once; statvfs results are cached briefly
+        self.recordings_path = self._resolve_recordings_path()
+
+        # Device id -> combo index, rebuilt whenever the combos are filled,
+        # and the (video, audio) lists the combos currently show
+        self._video_idx = {}
+        self._audio_idx = {}
+        self._shown_devices = None
+
+        # Background IP/storage probe
+        self._info_probe = None
+
+        # Email alerts dialog, built on first open
+        self._email_dialog = None
+        self._email_task = None
+
+        # Set once a restart is scheduled; execv replaces the process, so it
+        # never needs clearing
+        self._restart_pending = False
         
         self.setup_ui()
         self.load_settings()
     
+    @property
+    def systemd_mgr(self) -> SystemdManager:
+        """Systemd manager, created the first time a schedule is changed."""
+        if self._systemd_mgr is None:
+            self._systemd_mgr = SystemdManager(dry_run=False)
+        return self._systemd_mgr
+
     def setup_ui(self):
         """Setup the UI layout."""
         # Main layout with scroll area
@@ -59,6 +283,10 @@ class SettingsScreen(QWidget):
         scroll.setStyleSheet("QScrollArea { border: none; }")
 
         content_widget = QWidget()
+        # No repaints while the sections are being added; re-enabled once
+        # the finished widget is in the scroll area
+        content_widget.setUpdatesEnabled(False)
+        content_widget.setStyleSheet(SECTION_STYLE)
         content_layout = QVBoxLayout(content_widget)
         content_layout.setSpacing(6)
         content_layout.setContentsMargins(3, 3, 3, 3)
@@ -85,6 +313,7 @@ class SettingsScreen(QWidget):
         content_layout.addStretch()
         
         scroll.setWidget(content_widget)
+        content_widget.setUpdatesEnabled(True)
         main_layout.addWidget(scroll)
         
         # Back button - taller for touch
@@ -106,10 +335,49 @@ class SettingsScreen(QWidget):
         back_btn.clicked.connect(self.back_requested.emit)
         main_layout.addWidget(back_btn)
 
+        # Transient status message shown instead of a blocking message box
+        self._toast = QLabel(self)
+        self._toast.setAlignment(Qt.AlignCenter)
+        self._toast.setWordWrap(True)
+        self._toast.setStyleSheet("""
+            QLabel {
+                background-color: rgba(33, 33, 33, 220);
+                color: white;
+                border-radius: 6px;
+                font-size: 13px;
+                padding: 8px;
+            }
+        """)
+        self._toast.hide()
+
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.timeout.connect(self._toast.hide)
+
+    def show_toast(self, text: str):
+        """Show a short status message near the bottom of the screen.
+
+        Args:
+            text: Message to display
+        """
+        self._toast.setText(text)
+
+        # Bottom-center, just above the back button
+        width = min(self.width() - 40, 500)
+        height = self._toast.heightForWidth(width)
+        self._toast.setGeometry(
+            (self.width() - width) // 2,
+            self.height() - height - 60,
+            width,
+            height
+        )
+        self._toast.raise_()
+        self._toast.show()
+        self._toast_timer.start(TOAST_DURATION_MS)
+
     def create_device_section(self) -> QGroupBox:
         """Create device settings section."""
         group = QGroupBox("Devices")
-        group.setStyleSheet("QGroupBox { font-size: 13px; font-weight: bold; padding-top: 8px; }")
         layout = QVBoxLayout(group)
         layout.setSpacing(3)
         layout.setContentsMargins(4, 10, 4, 4)
@@ -118,12 +386,10 @@ class SettingsScreen(QWidget):
         video_row = QHBoxLayout()
         video_row.setSpacing(3)
         video_label = QLabel("Video:")
-        video_label.setStyleSheet("font-size: 11px;")
         video_label.setFixedWidth(45)
         video_row.addWidget(video_label)
         self.video_device_combo = QComboBox()
         self.video_device_combo.setMinimumHeight(38)
-        self.video_device_combo.setStyleSheet("font-size: 10px;")
         video_row.addWidget(self.video_device_combo)
         layout.addLayout(video_row)
 
@@ -131,25 +397,21 @@ class SettingsScreen(QWidget):
         audio_row = QHBoxLayout()
         audio_row.setSpacing(3)
         audio_label = QLabel("Audio:")
-        audio_label.setStyleSheet("font-size: 11px;")
         audio_label.setFixedWidth(45)
         audio_row.addWidget(audio_label)
         self.audio_device_combo = QComboBox()
         self.audio_device_combo.setMinimumHeight(38)
-        self.audio_device_combo.setStyleSheet("font-size: 10px;")
         audio_row.addWidget(self.audio_device_combo)
         layout.addLayout(audio_row)
 
         # Buttons - taller, stacked vertically
         detect_btn = QPushButton("🔍 Detect")
         detect_btn.setMinimumHeight(40)
-        detect_btn.setStyleSheet("font-size: 12px; font-weight: bold;")
-        detect_btn.clicked.connect(self.detect_devices)
+        detect_btn.clicked.connect(lambda: self.detect_devices(force=True))
         layout.addWidget(detect_btn)
 
         save_btn = QPushButton("💾 Save")
         save_btn.setMinimumHeight(40)
-        save_btn.setStyleSheet("font-size: 12px; font-weight: bold;")
         save_btn.clicked.connect(self.save_device_settings)
         layout.addWidget(save_btn)
 
@@ -158,7 +420,6 @@ class SettingsScreen(QWidget):
     def create_drive_section(self) -> QGroupBox:
         """Create Google Drive settings section."""
         group = QGroupBox("Google Drive")
-        group.setStyleSheet("QGroupBox { font-size: 13px; font-weight: bold; padding-top: 8px; }")
         layout = QVBoxLayout(group)
         layout.setSpacing(3)
         layout.setContentsMargins(4, 10, 4, 4)
@@ -167,7 +428,6 @@ class SettingsScreen(QWidget):
         remote_row = QHBoxLayout()
         remote_row.setSpacing(3)
         remote_label = QLabel("Remote:")
-        remote_label.setStyleSheet("font-size: 11px;")
         remote_label.setFixedWidth(55)
         remote_row.addWidget(remote_label)
         self.remote_input = QLineEdit()
@@ -180,7 +440,6 @@ class SettingsScreen(QWidget):
         folder_row = QHBoxLayout()
         folder_row.setSpacing(3)
         folder_label = QLabel("Folder:")
-        folder_label.setStyleSheet("font-size: 11px;")
         folder_label.setFixedWidth(55)
         folder_row.addWidget(folder_label)
 
@@ -212,13 +471,11 @@ class SettingsScreen(QWidget):
         # Buttons - taller, stacked
         test_btn = QPushButton("🔗 Test")
         test_btn.setMinimumHeight(40)
-        test_btn.setStyleSheet("font-size: 12px; font-weight: bold;")
         test_btn.clicked.connect(self.test_drive_connection)
         layout.addWidget(test_btn)
 
         save_btn = QPushButton("💾 Save")
         save_btn.setMinimumHeight(40)
-        save_btn.setStyleSheet("font-size: 12px; font-weight: bold;")
         save_btn.clicked.connect(self.save_drive_settings)
         layout.addWidget(save_btn)
 
@@ -227,7 +484,6 @@ class SettingsScreen(QWidget):
     def create_schedules_section(self) -> QGroupBox:
         """Create recording schedules section."""
         group = QGroupBox("Schedules")
-        group.setStyleSheet("QGroupBox { font-size: 13px; font-weight: bold; padding-top: 8px; }")
         layout = QVBoxLayout(group)
         layout.setSpacing(3)
         layout.setContentsMargins(4, 10, 4, 4)
@@ -238,7 +494,6 @@ class SettingsScreen(QWidget):
 
         self.schedule_list = QListWidget()
         self.schedule_list.setMinimumHeight(70)
-        self.schedule_list.setStyleSheet("font-size: 10px;")
         list_row.addWidget(self.schedule_list)
 
         # Buttons on the right side of list
@@ -264,9 +519,7 @@ class SettingsScreen(QWidget):
 
         # Add schedule form - vertical stack for touch
         self.day_combo = QComboBox()
-        self.day_combo.addItems([
-            "Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"
-        ])
+        self.day_combo.addItems(DAY_ABBREVIATIONS)
         self.day_combo.setMinimumHeight(38)
         self.day_combo.setStyleSheet("font-size: 11px;")
         layout.addWidget(self.day_combo)
@@ -296,7 +549,6 @@ class SettingsScreen(QWidget):
     def create_system_section(self) -> QGroupBox:
         """Create system information section."""
         group = QGroupBox("System")
-        group.setStyleSheet("QGroupBox { font-size: 13px; font-weight: bold; padding-top: 8px; }")
         layout = QVBoxLayout(group)
         layout.setSpacing(3)
         layout.setContentsMargins(4, 10, 4, 4)
@@ -305,7 +557,6 @@ class SettingsScreen(QWidget):
         name_row = QHBoxLayout()
         name_row.setSpacing(3)
         name_label = QLabel("Name:")
-        name_label.setStyleSheet("font-size: 11px;")
         name_label.setFixedWidth(45)
         name_row.addWidget(name_label)
 
@@ -342,7 +593,6 @@ class SettingsScreen(QWidget):
         kiosk_row.setSpacing(3)
         self.hide_taskbar_checkbox = QCheckBox("Kiosk")
         self.hide_taskbar_checkbox.setMinimumHeight(40)
-        self.hide_taskbar_checkbox.setStyleSheet("font-size: 11px;")
         kiosk_row.addWidget(self.hide_taskbar_checkbox)
 
         save_ui_btn = QPushButton("🔄 Apply")
@@ -363,9 +613,43 @@ class SettingsScreen(QWidget):
 
     def open_email_alerts_dialog(self):
         """Open email alerts configuration dialog."""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QCheckBox, QPushButton, QGridLayout
-        from PySide6.QtCore import Qt
+        # Built on first use and reused afterwards
+        if self._email_dialog is None:
+            self._email_dialog = self._build_email_alerts_dialog()
+        dialog = self._email_dialog
+
+        # Load current settings - signals blocked so the fields are toggled once
+        alerts_config = self.config.get_alerts_config()
+        with QSignalBlocker(self.email_enable_checkbox):
+            self.email_enable_checkbox.setChecked(alerts_config.get('enabled', False))
+        self.email_from_input.setText(alerts_config.get('email_from', ''))
+        email_to = alerts_config.get('email_to', [])
+        self.email_to_input.setText(email_to[0] if email_to else '')
+        self.email_password_input.setText(alerts_config.get('smtp_password', ''))
+        self._toggle_email_fields(self.email_enable_checkbox.isChecked())
+        if self._email_task is None:
+            self.email_status_label.clear()
+
+        # Show and position at top of screen
+        dialog.show()
+        # Get screen geometry
+        screen = dialog.screen()
+        if screen:
+            screen_geometry = screen.geometry()
+            # Position at top center
+            dialog_width = dialog.width()
+            x = (screen_geometry.width() - dialog_width) // 2
+            y = 20  # 20 pixels from top
+            dialog.move(x, y)
+
+        dialog.exec()
 
+    def _build_email_alerts_dialog(self):
+        """Build the email alerts configuration dialog.
+
+        Returns:
+            The dialog, with its input widgets stored on self
+        """
         dialog = QDialog(self)
         dialog.setWindowTitle("Email Alerts Settings")
         dialog.setMinimumWidth(700)
@@ -393,10 +677,11 @@ class SettingsScreen(QWidget):
         layout.addLayout(title_bar)
 
         # Enable checkbox
-        enable_checkbox = QCheckBox("Enable Email Alerts")
-        enable_checkbox.setMinimumHeight(32)
-        enable_checkbox.setStyleSheet("font-size: 11px; font-weight: bold;")
-        layout.addWidget(enable_checkbox)
+        self.email_enable_checkbox = QCheckBox("Enable Email Alerts")
+        self.email_enable_checkbox.setMinimumHeight(32)
+        self.email_enable_checkbox.setStyleSheet("font-size: 11px; font-weight: bold;")
+        self.email_enable_checkbox.toggled.connect(self._toggle_email_fields)
+        layout.addWidget(self.email_enable_checkbox)
 
         # Grid layout for compact form
         grid = QGridLayout()
@@ -409,11 +694,11 @@ class SettingsScreen(QWidget):
         from_label.setFixedWidth(80)
         grid.addWidget(from_label, 0, 0)
 
-        from_input = QLineEdit()
-        from_input.setPlaceholderText("filmbot-alerts@gmail.com")
-        from_input.setMinimumHeight(34)
-        from_input.setStyleSheet("font-size: 10px; padding: 2px;")
-        grid.addWidget(from_input, 0, 1)
+        self.email_from_input = QLineEdit()
+        self.email_from_input.setPlaceholderText("filmbot-alerts@gmail.com")
+        self.email_from_input.setMinimumHeight(34)
+        self.email_from_input.setStyleSheet("font-size: 10px; padding: 2px;")
+        grid.addWidget(self.email_from_input, 0, 1)
 
         # Email to - label and input on same row
         to_label = QLabel("Send To:")
@@ -421,11 +706,11 @@ class SettingsScreen(QWidget):
         to_label.setFixedWidth(80)
         grid.addWidget(to_label, 1, 0)
 
-        to_input = QLineEdit()
-        to_input.setPlaceholderText("admin@example.com")
-        to_input.setMinimumHeight(34)
-        to_input.setStyleSheet("font-size: 10px; padding: 2px;")
-        grid.addWidget(to_input, 1, 1)
+        self.email_to_input = QLineEdit()
+        self.email_to_input.setPlaceholderText("admin@example.com")
+        self.email_to_input.setMinimumHeight(34)
+        self.email_to_input.setStyleSheet("font-size: 10px; padding: 2px;")
+        grid.addWidget(self.email_to_input, 1, 1)
 
         # Password - label and input on same row
         pass_label = QLabel("App Password:")
@@ -433,12 +718,12 @@ class SettingsScreen(QWidget):
         pass_label.setFixedWidth(80)
         grid.addWidget(pass_label, 2, 0)
 
-        pass_input = QLineEdit()
-        pass_input.setPlaceholderText("xxxx xxxx xxxx xxxx")
-        pass_input.setEchoMode(QLineEdit.Password)
-        pass_input.setMinimumHeight(34)
-        pass_input.setStyleSheet("font-size: 10px; padding: 2px;")
-        grid.addWidget(pass_input, 2, 1)
+        self.email_password_input = QLineEdit()
+        self.email_password_input.setPlaceholderText("xxxx xxxx xxxx xxxx")
+        self.email_password_input.setEchoMode(QLineEdit.Password)
+        self.email_password_input.setMinimumHeight(34)
+        self.email_password_input.setStyleSheet("font-size: 10px; padding: 2px;")
+        grid.addWidget(self.email_password_input, 2, 1)
 
         # Help text below password
         pass_help = QLabel("Generate at: myaccount.google.com/apppasswords")
@@ -447,170 +732,133 @@ class SettingsScreen(QWidget):
 
         layout.addLayout(grid)
 
-        # Load current settings
-        alerts_config = self.config.get_alerts_config()
-        enable_checkbox.setChecked(alerts_config.get('enabled', False))
-        from_input.setText(alerts_config.get('email_from', ''))
-        email_to = alerts_config.get('email_to', [])
-        to_input.setText(email_to[0] if email_to else '')
-        pass_input.setText(alerts_config.get('smtp_password', ''))
-
-        # Toggle fields
-        def toggle_fields(enabled):
-            from_input.setEnabled(enabled)
-            to_input.setEnabled(enabled)
-            pass_input.setEnabled(enabled)
-
-        enable_checkbox.toggled.connect(toggle_fields)
-        toggle_fields(enable_checkbox.isChecked())
+        # Test email status
+        self.email_status_label = QLabel("")
+        self.email_status_label.setStyleSheet("font-size: 10px; color: #666;")
+        layout.addWidget(self.email_status_label)
 
         # Buttons - compact
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(4)
 
-        test_btn = QPushButton("📧 Test")
-        test_btn.setMinimumHeight(36)
-        test_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:pressed {
-                background-color: #1976D2;
-            }
-        """)
+        self.email_test_btn = QPushButton("📧 Test")
+        self.email_test_btn.setMinimumHeight(36)
+        self.email_test_btn.setStyleSheet(EMAIL_TEST_BUTTON_STYLE)
+        self.email_test_btn.clicked.connect(self._test_email)
+        btn_layout.addWidget(self.email_test_btn)
 
-        def test_email():
-            if not enable_checkbox.isChecked():
-                QMessageBox.warning(dialog, "Error", "Please enable email alerts first")
-                return
+        save_btn = QPushButton("💾 Save")
+        save_btn.setMinimumHeight(36)
+        save_btn.setStyleSheet(EMAIL_SAVE_BUTTON_STYLE)
+        save_btn.clicked.connect(self._save_email_alerts)
+        btn_layout.addWidget(save_btn)
 
-            email_from = from_input.text().strip()
-            email_to = to_input.text().strip()
-            password = pass_input.text().strip()
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setMinimumHeight(36)
+        cancel_btn.setStyleSheet(EMAIL_CANCEL_BUTTON_STYLE)
+        cancel_btn.clicked.connect(dialog.reject)
+        btn_layout.addWidget(cancel_btn)
 
-            if not email_from or not email_to or not password:
-                QMessageBox.warning(dialog, "Error", "Please fill in all fields")
-                return
+        layout.addLayout(btn_layout)
 
-            # Save temporarily
-            self.config.set_alerts_config(
-                enabled=True,
-                email_from=email_from,
-                email_to=[email_to],
-                smtp_password=password
-            )
+        return dialog
 
-            # Test sending
-            try:
-                from email_notify import EmailNotifier
-                notifier = EmailNotifier()
-                success = notifier.send_email(
-                    subject="Test Email from Filmbot",
-                    body="This is a test email. If you receive this, email alerts are working!",
-                    priority="info"
-                )
-
-                if success:
-                    QMessageBox.information(dialog, "Success", f"Test email sent to {email_to}!")
-                else:
-                    QMessageBox.warning(dialog, "Failed", "Failed to send test email. Check credentials.")
-            except Exception as e:
-                QMessageBox.critical(dialog, "Error", f"Error: {str(e)}")
-
-        test_btn.clicked.connect(test_email)
-        btn_layout.addWidget(test_btn)
+    def _toggle_email_fields(self, enabled: bool):
+        """Enable/disable email input fields based on checkbox."""
+        for field in (self.email_from_input, self.email_to_input, self.email_password_input):
+            field.setEnabled(enabled)
 
-        save_btn = QPushButton("💾 Save")
-        save_btn.setMinimumHeight(36)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:pressed {
-                background-color: #45a049;
-            }
-        """)
+    def _test_email(self):
+        """Send a test email with the values entered in the dialog."""
+        dialog = self._email_dialog
 
-        def save_settings():
-            enabled = enable_checkbox.isChecked()
+        if not self.email_enable_checkbox.isChecked():
+            QMessageBox.warning(dialog, "Error", "Please enable email alerts first")
+            return
 
-            if enabled:
-                email_from = from_input.text().strip()
-                email_to = to_input.text().strip()
-                password = pass_input.text().strip()
+        email_from = self.email_from_input.text().strip()
+        email_to = self.email_to_input.text().strip()
+        password = self.email_password_input.text().strip()
 
-                if not email_from or not email_to or not password:
-                    QMessageBox.warning(dialog, "Error", "Please fill in all fields")
-                    return
+        if not email_from or not email_to or not password:
+            QMessageBox.warning(dialog, "Error", "Please fill in all fields")
+            return
 
-                self.config.set_alerts_config(
-                    enabled=True,
-                    email_from=email_from,
-                    email_to=[email_to],
-                    smtp_password=password
-                )
-            else:
-                self.config.set_alerts_config(
-                    enabled=False,
-                    email_from="",
-                    email_to=[],
-                    smtp_password=""
-                )
+        # Save temporarily
+        self.config.set_alerts_config(
+            enabled=True,
+            email_from=email_from,
+            email_to=[email_to],
+            smtp_password=password
+        )
 
-            QMessageBox.information(dialog, "Success", "Email alerts settings saved!")
-            dialog.accept()
+        # Test sending - SMTP + TLS runs on the thread pool, not the UI thread
+        self.email_test_btn.setEnabled(False)
+        self.email_status_label.setText("Sending…")
 
-        save_btn.clicked.connect(save_settings)
-        btn_layout.addWidget(save_btn)
+        task = SendEmailTask(
+            subject="Test Email from Filmbot",
+            body="This is a test email. If you receive this, email alerts are working!",
+            priority="info"
+        )
+        task.signals.done.connect(
+            lambda success, error: self._on_test_email_done(success, error, email_to)
+        )
+        self._email_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_test_email_done(self, success: bool, error: str, email_to: str):
+        """Show the result of a test email sent from the thread pool."""
+        self._email_task = None
+        self.email_test_btn.setEnabled(True)
+
+        if error:
+            self.email_status_label.setText(f"Error: {error}")
+        elif success:
+            self.email_status_label.setText(f"Test email sent to {email_to}!")
+        else:
+            self.email_status_label.setText("Failed to send test email. Check credentials.")
 
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setMinimumHeight(36)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #757575;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:pressed {
-                background-color: #616161;
-            }
-        """)
-        cancel_btn.clicked.connect(dialog.reject)
-        btn_layout.addWidget(cancel_btn)
+    def _save_email_alerts(self):
+        """Save the email alerts settings entered in the dialog."""
+        dialog = self._email_dialog
+        enabled = self.email_enable_checkbox.isChecked()
 
-        layout.addLayout(btn_layout)
+        if enabled:
+            email_from = self.email_from_input.text().strip()
+            email_to = self.email_to_input.text().strip()
+            password = self.email_password_input.text().strip()
 
-        # Show and position at top of screen
-        dialog.show()
-        # Get screen geometry
-        screen = dialog.screen()
-        if screen:
-            screen_geometry = screen.geometry()
-            # Position at top center
-            dialog_width = dialog.width()
-            x = (screen_geometry.width() - dialog_width) // 2
-            y = 20  # 20 pixels from top
-            dialog.move(x, y)
+            if not email_from or not email_to or not password:
+                QMessageBox.warning(dialog, "Error", "Please fill in all fields")
+                return
 
-        dialog.exec()
+            self.config.set_alerts_config(
+                enabled=True,
+                email_from=email_from,
+                email_to=[email_to],
+                smtp_password=password
+            )
+        else:
+            self.config.set_alerts_config(
+                enabled=False,
+                email_from="",
+                email_to=[],
+                smtp_password=""
+            )
+
+        dialog.accept()
+        self.show_toast("Email alerts settings saved!")
 
     def load_settings(self):
-        """Load current settings from config."""
-        # Device settings
-        self.load_devices()
+        """Load current settings from config.
+
+        Plain fields are filled straight away. Device detection and the
+        schedule list are posted to later event-loop turns so the screen
+        can paint before they run.
+        """
+        # Device settings - detection can take a while on a cold cache
+        QTimer.singleShot(0, self.load_devices)
 
         # Drive settings
         drive_config = self.config.get_drive_config()
@@ -618,62 +866,88 @@ class SettingsScreen(QWidget):
         self.folder_input.setText(drive_config['folder'])
 
         # Schedules
-        self.load_schedules()
+        QTimer.singleShot(0, self.load_schedules)
 
         # System info
         self.device_name_input.setText(self.config.get_device_name())
         self.hostname_label.setText(f"Hostname: {socket.gethostname()}")
 
-        # Get IP address
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            self.ip_label.setText(f"IP: {ip}")
-        except:
-            self.ip_label.setText("IP: Not connected")
-
-        # Storage info
-        self.update_storage_info()
+        # IP address and storage info - probed on the thread pool
+        self.update_system_info()
 
         # UI settings
         self.hide_taskbar_checkbox.setChecked(self.config.get_hide_taskbar())
 
     def load_schedules(self):
         """Load schedules into list."""
-        self.schedule_list.clear()
-        # Map full day names to abbreviations
-        day_abbrev = {
-            'sunday': 'Sun', 'monday': 'Mon', 'tuesday': 'Tue',
-            'wednesday': 'Wed', 'thursday': 'Thu', 'friday': 'Fri', 'saturday': 'Sat'
-        }
-        for schedule in self.config.get_schedules():
-            day = day_abbrev.get(schedule['day_of_week'].lower(), schedule['day_of_week'][:3])
-            time = schedule['start_time']
-            duration = schedule['duration_minutes']
-            text = f"{day} {time} ({duration}m)"
+        # Suppress per-item signals and repaints while refilling
+        self.schedule_list.setUpdatesEnabled(False)
+        self.schedule_list.blockSignals(True)
+        try:
+            self.schedule_list.clear()
+            for schedule in self.config.get_schedules():
+                day = DAY_ABBREVIATIONS[schedule['day_of_week']]
+                time = schedule['start_time']
+                duration = schedule['duration_minutes']
+                text = f"{day} {time} ({duration}m)"
+
+                item = QListWidgetItem(text)
+                item.setData(Qt.UserRole, schedule['id'])
+                self.schedule_list.addItem(item)
+        finally:
+            self.schedule_list.blockSignals(False)
+            self.schedule_list.setUpdatesEnabled(True)
+
+    def _resolve_recordings_path(self) -> Path:
+        """Resolve the recordings directory once.
+
+        Returns:
+            NVMe recordings path if the drive is mounted, else a home fallback
+        """
+        recordings_path = NVME_MOUNT / "recordings"
+        if os.path.ismount(NVME_MOUNT) and recordings_path.is_dir():
+            return recordings_path
+
+        recordings_path = Path.home() / "filmbot-recordings"
+        recordings_path.mkdir(exist_ok=True)
+        return recordings_path
+
+    def update_system_info(self):
+        """Update IP address and storage information without blocking the UI."""
+        self.ip_label.setText("IP: …")
+
+        # Storage only needs probing once the cached value has expired
+        storage_path = None
+        cached = _cached_storage_usage(self.recordings_path)
+        if cached is not None:
+            self._show_storage_usage(*cached)
+        else:
+            self.storage_info_label.setText("Storage: …")
+            storage_path = self.recordings_path
 
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, schedule['id'])
-            self.schedule_list.addItem(item)
+        probe = _InfoProbe(storage_path)
+        probe.signals.ip_ready.connect(self._on_ip_ready)
+        probe.signals.storage_ready.connect(self._on_storage_ready)
+        probe.signals.storage_failed.connect(self._on_storage_failed)
+        self._info_probe = probe
+        QThreadPool.globalInstance().start(probe)
 
-    def update_storage_info(self):
-        """Update storage information."""
-        import os
-        recordings_path = Path("/mnt/nvme/recordings")
+    def _on_ip_ready(self, ip: str):
+        """Show the IP address found by the info probe."""
+        self.ip_label.setText(f"IP: {ip}" if ip else "IP: Not connected")
 
-        if not recordings_path.exists():
-            recordings_path = Path.home() / "filmbot-recordings"
-            recordings_path.mkdir(exist_ok=True)
+    def _on_storage_ready(self, used_gb: float, total_gb: float):
+        """Show and cache storage usage found by the info probe."""
+        _storage_cache[self.recordings_path] = (time.monotonic(), used_gb, total_gb)
+        self._show_storage_usage(used_gb, total_gb)
 
-        try:
-            stat = os.statvfs(recordings_path)
-            total_gb = (stat.f_blocks * stat.f_frsize) / (1024**3)
-            used_gb = ((stat.f_blocks - stat.f_bfree) * stat.f_frsize) / (1024**3)
-            self.storage_info_label.setText(f"Storage: {used_gb:.1f} GB / {total_gb:.1f} GB")
-        except:
-            self.storage_info_label.setText("Storage: --")
+    def _show_storage_usage(self, used_gb: float, total_gb: float):
+        """Show storage usage in the system section."""
+        self.storage_info_label.setText(f"Storage: {used_gb:.1f} GB / {total_gb:.1f} GB")
+
+    def _on_storage_failed(self):
+        """Handle the info probe failing to read storage usage."""
+        self.storage_info_label.setText("Storage: --")
 
     def browse_drive_folders(self):
         """Browse Google Drive folders using rclone."""
@@ -683,57 +957,55 @@ class SettingsScreen(QWidget):
             QMessageBox.warning(self, "Error", "Please enter a remote name first")
             return
 
-        try:
-            # Get current folder or root
-            current_folder = self.folder_input.text().strip()
-
-            # List directories
-            result = subprocess.run(
-                ['rclone', 'lsd', f"{remote}{current_folder}"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+        # Ignore repeated taps while a listing is still running
+        if self._browse_busy:
+            return
+        self._browse_busy = True
 
-            if result.returncode != 0:
-                QMessageBox.warning(self, "Error", f"Failed to list folders:\n{result.stderr}")
-                return
+        # Get current folder or root
+        self._browse_folder = self.folder_input.text().strip()
 
-            # Parse folder list
-            folders = []
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    # rclone lsd format: "          -1 2024-01-01 12:00:00        -1 FolderName"
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        folder_name = ' '.join(parts[4:])
-                        folders.append(folder_name)
-
-            if not folders:
-                QMessageBox.information(self, "Browse", "No folders found in this location")
-                return
+        # Listed by the rclone daemon, or rclone lsd until it is up
+        list_remote_dirs(remote, self._browse_folder, self._on_browse_listed)
 
-            # Show folder selection dialog
-            from PySide6.QtWidgets import QInputDialog
-            folder, ok = QInputDialog.getItem(
-                self,
-                "Select Folder",
-                "Choose a folder:",
-                folders,
-                0,
-                False
-            )
+    def _on_browse_listed(self, folders, error: str):
+        """Show folder selection once the folders have been listed."""
+        self._browse_busy = False
+
+        if folders is None:
+            QMessageBox.warning(self, "Error", f"Failed to list folders:\n{error}")
+            return
+
+        self._show_folder_choices(folders)
+
+    def _show_folder_choices(self, folders):
+        """Let the user pick one of the listed folders.
+
+        Args:
+            folders: Folder names found under the current folder
+        """
+        if not folders:
+            self.show_toast("No folders found in this location")
+            return
 
-            if ok and folder:
-                # Append to current path
-                if current_folder:
-                    new_path = f"{current_folder}/{folder}"
-                else:
-                    new_path = folder
-                self.folder_input.setText(new_path)
+        # Show folder selection dialog
+        folder, ok = QInputDialog.getItem(
+            self,
+            "Select Folder",
+            "Choose a folder:",
+            folders,
+            0,
+            False
+        )
 
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Browse failed: {str(e)}")
+        if ok and folder:
+            # Append to current path
+            current_folder = self._browse_folder
+            if current_folder:
+                new_path = f"{current_folder}/{folder}"
+            else:
+                new_path = folder
+            self.folder_input.setText(new_path)
 
     def test_drive_connection(self):
         """Test Google Drive connection."""
@@ -744,20 +1016,36 @@ class SettingsScreen(QWidget):
             QMessageBox.warning(self, "Error", "Please enter a remote name")
             return
 
-        try:
-            result = subprocess.run(
-                ['rclone', 'lsd', f"{remote}{folder}"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+        # Same remote and folder passed moments ago - no need to ask Drive again
+        last_remote, last_folder, last_ts = self._last_test_ok
+        if ((remote, folder) == (last_remote, last_folder)
+                and time.monotonic() - last_ts < DRIVE_TEST_CACHE_TTL):
+            self.show_toast("Connection test successful!")
+            return
 
-            if result.returncode == 0:
-                QMessageBox.information(self, "Success", "Connection test successful!")
-            else:
-                QMessageBox.warning(self, "Error", f"Connection failed:\n{result.stderr}")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Test failed: {str(e)}")
+        # Ignore repeated taps while a test is still running
+        if self._test_busy:
+            return
+        self._test_busy = True
+        self._test_target = (remote, folder)
+        self.show_toast("Testing connection…")
+
+        # Listed by the rclone daemon, or rclone lsd until it is up
+        list_remote_dirs(remote, folder, self._on_test_listed)
+
+    def _on_test_listed(self, folders, error: str):
+        """Report the result of the connection test."""
+        self._test_busy = False
+
+        if folders is None:
+            QMessageBox.warning(self, "Error", f"Connection failed:\n{error}")
+        else:
+            self._on_test_passed()
+
+    def _on_test_passed(self):
+        """Remember a successful test and report it."""
+        self._last_test_ok = (*self._test_target, time.monotonic())
+        self.show_toast("Connection test successful!")
 
     def save_drive_settings(self):
         """Save Google Drive settings."""
@@ -769,11 +1057,12 @@ class SettingsScreen(QWidget):
             return
 
         self.config.set_drive_config(remote, folder)
-        QMessageBox.information(self, "Success", "Drive settings saved!")
+        self.show_toast("Drive settings saved!")
 
     def add_schedule(self):
         """Add a new recording schedule."""
-        day = self.day_combo.currentText().lower()
+        # Combo order matches the stored day index (0 = Sunday)
+        day = self.day_combo.currentIndex()
         time = self.time_edit.time().toString("HH:mm")
         duration = self.duration_spin.value()
 
@@ -794,7 +1083,7 @@ class SettingsScreen(QWidget):
             return
 
         self.load_schedules()
-        QMessageBox.information(self, "Success", "Schedule added and timer created!")
+        self.show_toast("Schedule added and timer created!")
 
     def remove_schedule(self):
         """Remove selected schedule."""
@@ -812,19 +1101,24 @@ class SettingsScreen(QWidget):
 
         self.config.remove_schedule(schedule_id)
         self.load_schedules()
-        QMessageBox.information(self, "Success", "Schedule and timer removed!")
+        self.show_toast("Schedule and timer removed!")
 
     def save_device_name(self):
         """Save device name."""
         name = self.device_name_input.text().strip()
         if name:
             self.config.set_device_name(name)
-            QMessageBox.information(self, "Success", "Device name saved!")
+            self.show_toast("Device name saved!")
         else:
             QMessageBox.warning(self, "Error", "Please enter a device name")
 
     def save_ui_settings(self):
         """Save UI settings."""
+        if self._restart_pending:
+            return
+        # Set before exec(): its nested event loop can deliver another tap
+        self._restart_pending = True
+
         hide_taskbar = self.hide_taskbar_checkbox.isChecked()
         self.config.set_hide_taskbar(hide_taskbar)
 
@@ -845,42 +1139,67 @@ class SettingsScreen(QWidget):
         main_window = self.window()
         main_window.close()
 
-        # Restart using the same executable and arguments
-        subprocess.Popen([sys.executable] + sys.argv)
-        sys.exit(0)
+        # Replace this process with a fresh one using the same executable and
+        # arguments - no second interpreter running alongside the old one
+        os.execv(sys.executable, [sys.executable] + sys.argv)
 
     def load_devices(self):
         """Load device settings into combos."""
-        self.detect_devices()
+        self.detect_devices(force=False)
 
         # Select current devices
         devices = self.config.get_devices()
 
         # Select current video device
-        for i in range(self.video_device_combo.count()):
-            if self.video_device_combo.itemData(i) == devices['video_device']:
-                self.video_device_combo.setCurrentIndex(i)
-                break
+        idx = self._video_idx.get(devices['video_device'])
+        if idx is not None:
+            self.video_device_combo.setCurrentIndex(idx)
 
         # Select current audio device
-        for i in range(self.audio_device_combo.count()):
-            if self.audio_device_combo.itemData(i) == devices['audio_device']:
-                self.audio_device_combo.setCurrentIndex(i)
-                break
-
-    def detect_devices(self):
-        """Detect available devices."""
-        # Detect video devices
-        video_devices = detect_video_devices()
-        self.video_device_combo.clear()
-        for device_path, device_name in video_devices:
-            self.video_device_combo.addItem(f"{device_name}", device_path)
-
-        # Detect audio devices
-        audio_devices = detect_audio_devices()
-        self.audio_device_combo.clear()
-        for device_id, device_name in audio_devices:
-            self.audio_device_combo.addItem(f"{device_name}", device_id)
+        idx = self._audio_idx.get(devices['audio_device'])
+        if idx is not None:
+            self.audio_device_combo.setCurrentIndex(idx)
+
+    def detect_devices(self, force: bool = True):
+        """Detect available devices.
+
+        Args:
+            force: Rescan even if no device was hotplugged since the last scan
+        """
+        video_devices = detect_video_devices(refresh=force)
+        audio_devices = detect_audio_devices(refresh=force)
+
+        # Combos already show this list - keep them (and the user's selection)
+        if not force and self._shown_devices == (video_devices, audio_devices):
+            return
+        self._shown_devices = (video_devices, audio_devices)
+
+        self._video_idx = self._populate_device_combo(self.video_device_combo, video_devices)
+        self._audio_idx = self._populate_device_combo(self.audio_device_combo, audio_devices)
+
+    def _populate_device_combo(self, combo: QComboBox, devices):
+        """Fill a device combo in one batch.
+
+        Args:
+            combo: Combo box to fill
+            devices: List of (device_id, device_name) tuples
+
+        Returns:
+            Dict mapping device_id to its combo index
+        """
+        # Suppress per-item signals and repaints while filling
+        combo.setUpdatesEnabled(False)
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems([device_name for _, device_name in devices])
+            for i, (device_id, _) in enumerate(devices):
+                combo.setItemData(i, device_id)
+        finally:
+            combo.blockSignals(False)
+            combo.setUpdatesEnabled(True)
+
+        return {device_id: i for i, (device_id, _) in enumerate(devices)}
 
     def save_device_settings(self):
         """Save device settings."""
@@ -892,8 +1211,4 @@ class SettingsScreen(QWidget):
         audio_device = self.audio_device_combo.currentData()
 
         self.config.set_devices(video_device, audio_device)
-        QMessageBox.information(
-            self,
-            "Success",
-            "Device settings saved!\n\nRestart the UI for changes to take effect."
-        )
+        self.show_toast("Device settings saved! Restart the UI for changes to take effect.")
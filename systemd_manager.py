@@ -4,13 +4,28 @@ Generates and manages recording timer services.
 """
 
 import subprocess
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+from config_manager import DAY_NAMES, day_index
+
+# OnCalendar day abbreviations indexed by schedule day_of_week (0 = Sunday)
+CALENDAR_DAYS = tuple(name[:3].capitalize() for name in DAY_NAMES)
+
+# Root-owned helper (filmbot-units.sh) that writes and removes the recording
+# units; it is the only unit-file command the filmbot user may run via sudo
+UNIT_HELPER = "/usr/local/sbin/filmbot-units"
+
+# (OnCalendar day, start time HH:MM, duration seconds) for one schedule
+UnitSpec = Tuple[str, str, int]
 
 
 class SystemdManager:
     """Manages systemd timer services for scheduled recordings."""
     
+    # Must match the units filmbot-units writes; used for dry runs and to
+    # skip rewriting units that haven't changed
     SERVICE_TEMPLATE = """[Unit]
 Description=Filmbot Recording {schedule_id}
 After=network.target
@@ -38,6 +53,13 @@ WantedBy=timers.target
 """
     
     SYSTEMD_PATH = Path("/etc/systemd/system")
+
+    # Fixed command prefixes, built once
+    DAEMON_RELOAD_CMD = ('sudo', 'systemctl', 'daemon-reload')
+    ENABLE_NOW_CMD = ('sudo', UNIT_HELPER, 'enable')
+    DISABLE_NOW_CMD = ('sudo', UNIT_HELPER, 'disable')
+    WRITE_UNITS_CMD = ('sudo', UNIT_HELPER, 'write')
+    REMOVE_UNITS_CMD = ('sudo', UNIT_HELPER, 'remove')
     
     def __init__(self, dry_run: bool = False):
         """Initialize systemd manager.
@@ -46,12 +68,128 @@ WantedBy=timers.target
             dry_run: If True, don't actually write files or run systemctl commands
         """
         self.dry_run = dry_run
-    
-    def _run_command(self, cmd: List[str]) -> bool:
+
+        # Inside batch(): unit file writes, daemon-reload and timer enables
+        # are held back and run once when the outermost batch ends.
+        # _reload_pending forces the reload (files were removed); units
+        # written in the batch only trigger it if systemd says so.
+        self._batch_depth = 0
+        self._reload_pending = False
+        self._pending_units: Dict[str, UnitSpec] = {}
+        self._pending_enables: List[str] = []
+        self._batch_ok = True
+
+    @contextmanager
+    def batch(self):
+        """Coalesce file writes and daemon-reload across several schedule changes.
+
+        Unit files are removed as usual, but new ones are written together
+        and systemd is reloaded only once, when the outermost batch exits,
+        after which all timers created in the batch are enabled with a
+        single helper call. If the body raises, nothing held back is
+        written or enabled.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            # Don't reload/enable a half-written set of units; just forget
+            # what was held back and let the error propagate
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._reset_batch()
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._batch_ok = self._flush_batch()
+
+    def _reset_batch(self):
+        """Drop everything held back by batch()."""
+        self._pending_units = {}
+        self._pending_enables = []
+        self._reload_pending = False
+
+    def _flush_batch(self) -> bool:
+        """Write, reload and enable everything held back by batch().
+
+        Returns:
+            True if successful, False otherwise
+        """
+        units = self._pending_units
+        enables = self._pending_enables
+        force_reload = self._reload_pending
+        self._reset_batch()
+
+        if units and not self._write_units(units):
+            # Still pick up removals, but don't enable unwritten timers
+            if force_reload:
+                self._reload_and_enable([])
+            return False
+
+        if not (force_reload or units):
+            return True
+        return self._reload_and_enable(enables, None if force_reload else self._unit_names(units))
+
+    def _needs_reload(self, units: List[str]) -> bool:
+        """Check whether systemd must be reloaded to see the given unit files.
+
+        A reload is needed if any unit isn't loaded yet or systemd reports
+        NeedDaemonReload (its file changed on disk). Rewriting a unit with
+        the same content needs neither.
+
+        Args:
+            units: Unit names
+
+        Returns:
+            True if a daemon-reload is needed (or the check failed)
+        """
+        if self.dry_run:
+            return True
+
+        try:
+            result = subprocess.run(
+                ['systemctl', 'show', '-p', 'LoadState', '-p', 'NeedDaemonReload'] + units,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=5
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            return True
+
+        for line in result.stdout.splitlines():
+            if line == 'NeedDaemonReload=yes':
+                return True
+            if line.startswith('LoadState=') and line != 'LoadState=loaded':
+                return True
+        return False
+
+    def _reload_and_enable(self, schedule_ids: List[str], units: Optional[List[str]] = None) -> bool:
+        """Reload systemd if needed, then enable and start the schedules' timers.
+
+        Args:
+            schedule_ids: Schedules whose timers to enable (may be empty)
+            units: Unit files just written; the reload is skipped if systemd
+                reports none of them need it. None always reloads.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        reload = units is None or self._needs_reload(units)
+
+        if reload and not self._run_command(self.DAEMON_RELOAD_CMD):
+            return False
+
+        if schedule_ids:
+            return self._run_command([*self.ENABLE_NOW_CMD, *schedule_ids])
+        return True
+
+    def _run_command(self, cmd: Sequence[str]) -> bool:
         """Run a shell command.
         
         Args:
-            cmd: Command and arguments as list
+            cmd: Command and arguments as list or tuple
             
         Returns:
             True if successful, False otherwise
@@ -68,66 +206,81 @@ WantedBy=timers.target
             print(f"stderr: {e.stderr}")
             return False
     
-    def _write_file(self, path: Path, content: str) -> bool:
-        """Write content to file using sudo.
+    def _unit_names(self, schedule_ids: Iterable[str]) -> List[str]:
+        """Get the service and timer unit names for some schedules.
 
         Args:
-            path: File path
-            content: File content
+            schedule_ids: Schedule IDs
 
         Returns:
-            True if successful, False otherwise
+            Unit names, service then timer for each schedule
         """
-        if self.dry_run:
-            print(f"[DRY RUN] Would write to {path}:")
-            print(content)
-            return True
+        return [
+            f"filmbot-record-{schedule_id}.{kind}"
+            for schedule_id in schedule_ids
+            for kind in ('service', 'timer')
+        ]
 
-        try:
-            # Use sudo tee to write the file with elevated permissions
-            result = subprocess.run(
-                ['sudo', 'tee', str(path)],
-                input=content,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Error writing file {path}: {e}")
-            print(f"stderr: {e.stderr}")
-            return False
-    
-    def _day_to_calendar(self, day_of_week: str, start_time: str) -> str:
-        """Convert day and time to systemd OnCalendar format.
+    def _render_units(self, schedule_id: str, spec: UnitSpec) -> Dict[str, str]:
+        """Render a schedule's unit files the way filmbot-units writes them.
 
         Args:
-            day_of_week: Day name (e.g., 'sunday', 'monday', 'sun', 'mon')
-            start_time: Time in HH:MM format
+            schedule_id: Schedule ID
+            spec: (OnCalendar day, start time, duration seconds)
 
         Returns:
-            OnCalendar string (e.g., 'Sun 09:20')
+            Unit file name -> content
         """
-        day_map = {
-            'monday': 'Mon',
-            'mon': 'Mon',
-            'tuesday': 'Tue',
-            'tue': 'Tue',
-            'wednesday': 'Wed',
-            'wed': 'Wed',
-            'thursday': 'Thu',
-            'thu': 'Thu',
-            'friday': 'Fri',
-            'fri': 'Fri',
-            'saturday': 'Sat',
-            'sat': 'Sat',
-            'sunday': 'Sun',
-            'sun': 'Sun'
+        day, start_time, duration = spec
+        service_name, timer_name = self._unit_names([schedule_id])
+        return {
+            service_name: self.SERVICE_TEMPLATE.format(
+                schedule_id=schedule_id,
+                duration=duration
+            ),
+            timer_name: self.TIMER_TEMPLATE.format(
+                schedule_id=schedule_id,
+                on_calendar=f"{day} {start_time}"
+            ),
         }
 
-        day_abbr = day_map.get(day_of_week.lower(), 'Sun')
-        return f"{day_abbr} {start_time}"
-    
+    def _write_units(self, units: Dict[str, UnitSpec]) -> bool:
+        """Write schedules' unit files with a single sudo call.
+
+        Schedules whose files are already on disk with the same content are
+        skipped. filmbot-units renders and installs the rest.
+
+        Args:
+            units: Schedule ID -> (OnCalendar day, start time, duration seconds)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        args = []
+        for schedule_id, spec in units.items():
+            files = self._render_units(schedule_id, spec)
+
+            if self.dry_run:
+                for name, content in files.items():
+                    print(f"[DRY RUN] Would write to {self.SYSTEMD_PATH / name}:")
+                    print(content)
+                continue
+
+            # Unit files are world-readable; skip the sudo round trip (and
+            # the daemon-reload it would cause) when nothing changed
+            try:
+                if all((self.SYSTEMD_PATH / name).read_text() == content
+                       for name, content in files.items()):
+                    continue
+            except OSError:
+                pass
+            day, start_time, duration = spec
+            args += [schedule_id, day, start_time, str(duration)]
+
+        if not args:
+            return True
+        return self._run_command([*self.WRITE_UNITS_CMD, *args])
+
     def create_schedule_services(self, schedule: Dict[str, Any]) -> bool:
         """Create systemd service and timer files for a schedule.
         
@@ -138,43 +291,40 @@ WantedBy=timers.target
             True if successful, False otherwise
         """
         schedule_id = schedule['id']
-        duration_seconds = schedule['duration_minutes'] * 60
-        on_calendar = self._day_to_calendar(schedule['day_of_week'], schedule['start_time'])
-        
-        # Generate service file
-        service_content = self.SERVICE_TEMPLATE.format(
-            schedule_id=schedule_id,
-            duration=duration_seconds
-        )
-        
-        # Generate timer file
-        timer_content = self.TIMER_TEMPLATE.format(
-            schedule_id=schedule_id,
-            on_calendar=on_calendar
+        spec = (
+            CALENDAR_DAYS[day_index(schedule['day_of_week'])],
+            schedule['start_time'],
+            schedule['duration_minutes'] * 60
         )
-        
-        # Write files
-        service_path = self.SYSTEMD_PATH / f"filmbot-record-{schedule_id}.service"
-        timer_path = self.SYSTEMD_PATH / f"filmbot-record-{schedule_id}.timer"
-        
-        if not self._write_file(service_path, service_content):
-            return False
-        
-        if not self._write_file(timer_path, timer_content):
-            return False
-        
-        # Reload systemd
-        if not self._run_command(['sudo', 'systemctl', 'daemon-reload']):
+
+        # Enable and start timer if schedule is enabled (one helper call)
+        enables = [schedule_id] if schedule.get('enabled', True) else []
+
+        # Batched: write, reload and enable once when the batch ends
+        if self._batch_depth:
+            self._pending_units[schedule_id] = spec
+            self._pending_enables.extend(enables)
+            return True
+
+        # Write both files together
+        if not self._write_units({schedule_id: spec}):
             return False
-        
-        # Enable and start timer if schedule is enabled
-        if schedule.get('enabled', True):
-            if not self._run_command(['sudo', 'systemctl', 'enable', f"filmbot-record-{schedule_id}.timer"]):
-                return False
-            if not self._run_command(['sudo', 'systemctl', 'start', f"filmbot-record-{schedule_id}.timer"]):
-                return False
-        
-        return True
+
+        # Reload systemd if the new files need it, then enable
+        return self._reload_and_enable(enables, self._unit_names([schedule_id]))
+
+    def create_schedule_services_bulk(self, schedules: Iterable[Dict[str, Any]]) -> bool:
+        """Create systemd services for several schedules with a single reload.
+
+        Args:
+            schedules: Schedule dictionaries, as for create_schedule_services
+
+        Returns:
+            True if every schedule was created and enabled, False otherwise
+        """
+        with self.batch():
+            results = [self.create_schedule_services(schedule) for schedule in schedules]
+        return all(results) and self._batch_ok
     
     def remove_schedule_services(self, schedule_id: str) -> bool:
         """Remove systemd service and timer files for a schedule.
@@ -185,19 +335,21 @@ WantedBy=timers.target
         Returns:
             True if successful, False otherwise
         """
-        # Stop and disable timer
-        self._run_command(['sudo', 'systemctl', 'stop', f"filmbot-record-{schedule_id}.timer"])
-        self._run_command(['sudo', 'systemctl', 'disable', f"filmbot-record-{schedule_id}.timer"])
+        # Drop anything a surrounding batch still has to write for it
+        if self._batch_depth:
+            self._pending_units.pop(schedule_id, None)
+            self._pending_enables = [i for i in self._pending_enables if i != schedule_id]
 
-        # Remove files using sudo
-        service_path = self.SYSTEMD_PATH / f"filmbot-record-{schedule_id}.service"
-        timer_path = self.SYSTEMD_PATH / f"filmbot-record-{schedule_id}.timer"
+        # Stop and disable timer (one helper call)
+        self._run_command([*self.DISABLE_NOW_CMD, schedule_id])
 
-        if service_path.exists():
-            self._run_command(['sudo', 'rm', str(service_path)])
-        if timer_path.exists():
-            self._run_command(['sudo', 'rm', str(timer_path)])
+        # Remove both files with one helper call, if either is there
+        if any((self.SYSTEMD_PATH / name).exists() for name in self._unit_names([schedule_id])):
+            self._run_command([*self.REMOVE_UNITS_CMD, schedule_id])
 
-        # Reload systemd
-        return self._run_command(['sudo', 'systemctl', 'daemon-reload'])
+        # Reload systemd (deferred to the end of a batch)
+        if self._batch_depth:
+            self._reload_pending = True
+            return True
+        return self._reload_and_enable([])
 
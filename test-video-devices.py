@@ -6,75 +6,107 @@ Helps diagnose ATEM Mini capture issues.
 
 import cv2
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def test_device(device_path):
-    """Test if a video device can capture frames."""
-    print(f"\n{'='*60}")
-    print(f"Testing: {device_path}")
-    print('='*60)
+FOURCC_MJPG = cv2.VideoWriter_fourcc('M', 'J', 'P', 'G')
+FOURCC_YUYV = cv2.VideoWriter_fourcc('Y', 'U', 'Y', 'V')
+
+# Formats to retry with when the default one fails: (name, fourcc, width, height)
+FORMAT_PROBE_ORDER = (
+    ("MJPEG", FOURCC_MJPG, 1920, 1080),
+    ("YUYV", FOURCC_YUYV, 1920, 1080),
+)
+
+def frame_size(cap):
+    """Describe the negotiated frame size of an open capture.
+
+    Args:
+        cap: cv2.VideoCapture that has grabbed a frame
+
+    Returns:
+        Size string (e.g., '1920x1080')
+    """
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    return f"{width}x{height}"
+
+def test_device(device_path, log=print):
+    """Test if a video device can capture frames.
+
+    Args:
+        device_path: Path to video device
+        log: Called with each line of the report (prints by default)
+
+    Returns:
+        True if the device produced a frame
+    """
+    log(f"\n{'='*60}")
+    log(f"Testing: {device_path}")
+    log('='*60)
     
     # Try to open device
     cap = cv2.VideoCapture(device_path, cv2.CAP_V4L2)
     
     if not cap.isOpened():
-        print(f"❌ Cannot open device")
+        log(f"❌ Cannot open device")
         return False
     
-    print(f"✓ Device opened successfully")
+    log(f"✓ Device opened successfully")
     
     # Get device properties
     width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
     height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
     fps = cap.get(cv2.CAP_PROP_FPS)
     fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
-    fourcc_str = "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)])
+    fourcc_str = (fourcc & 0xFFFFFFFF).to_bytes(4, 'little').decode('ascii', errors='replace')
     
-    print(f"  Resolution: {int(width)}x{int(height)}")
-    print(f"  FPS: {fps}")
-    print(f"  Format: {fourcc_str}")
+    log(f"  Resolution: {int(width)}x{int(height)}")
+    log(f"  FPS: {fps}")
+    log(f"  Format: {fourcc_str}")
     
-    # Try to read a frame
-    print(f"\nAttempting to read frame...")
-    ret, frame = cap.read()
+    # Try to read a frame - grab() only dequeues it, skipping the decode
+    log(f"\nAttempting to read frame...")
+    ret = cap.grab()
     
     if ret:
-        print(f"✓ Successfully read frame: {frame.shape}")
+        log(f"✓ Successfully read frame: {frame_size(cap)}")
         cap.release()
         return True
     else:
-        print(f"❌ Failed to read frame")
+        log(f"❌ Failed to read frame")
         
-        # Try with MJPEG
-        print(f"\nRetrying with MJPEG format...")
-        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-        
-        ret, frame = cap.read()
-        if ret:
-            print(f"✓ MJPEG worked! Frame: {frame.shape}")
-            cap.release()
-            return True
-        
-        # Try with YUYV
-        print(f"\nRetrying with YUYV format...")
-        cap.release()
-        cap = cv2.VideoCapture(device_path, cv2.CAP_V4L2)
-        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('Y', 'U', 'Y', 'V'))
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-        
-        ret, frame = cap.read()
-        if ret:
-            print(f"✓ YUYV worked! Frame: {frame.shape}")
+        # Try each explicit format on a freshly opened device
+        for name, fourcc, width, height in FORMAT_PROBE_ORDER:
+            log(f"\nRetrying with {name} format...")
             cap.release()
-            return True
+            cap = cv2.VideoCapture(device_path, cv2.CAP_V4L2)
+            cap.set(cv2.CAP_PROP_FOURCC, fourcc)
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            
+            if cap.grab():
+                log(f"✓ {name} worked! Frame: {frame_size(cap)}")
+                cap.release()
+                return True
         
-        print(f"❌ All formats failed")
+        log(f"❌ All formats failed")
         cap.release()
         return False
 
+def probe_device(device):
+    """Run test_device, collecting its report instead of printing it.
+
+    Args:
+        device: Path to video device
+
+    Returns:
+        Tuple of (works, report_lines)
+    """
+    lines = []
+    works = test_device(str(device), lines.append)
+    return works, lines
+
 def main():
     """Test all video devices."""
     print("Filmbot Video Device Tester")
@@ -92,10 +124,16 @@ def main():
     for dev in video_devices:
         print(f"  - {dev}")
     
-    # Test each device
+    # Test all devices at once - probing is mostly waiting on V4L2 and USB,
+    # so threads overlap the waits. Reports are printed in device order.
+    with ThreadPoolExecutor(max_workers=len(video_devices)) as pool:
+        results = list(pool.map(probe_device, video_devices))
+
     working_devices = []
-    for device in video_devices:
-        if test_device(str(device)):
+    for device, (works, lines) in zip(video_devices, results):
+        for line in lines:
+            print(line)
+        if works:
             working_devices.append(device)
     
     # Summary
@@ -2,17 +2,23 @@
 """
 Test script for Filmbot UI
 Run this on a development machine to test the UI without Raspberry Pi hardware.
+Pass --auto to run every screen unattended, closing each after a moment.
 """
 
 import sys
 import os
+import tempfile
 from pathlib import Path
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QEventLoop, QTimer
+
+# With --auto, each window closes itself after this long and every screen
+# is tested without asking
+AUTO_CLOSE_MS = 2000
 
 from config_manager import ConfigManager
 from wizard import SetupWizard
@@ -20,19 +26,12 @@ from live_view import LiveView
 from settings import SettingsScreen
 
 
-def test_config_manager():
+def test_config_manager(config_dir: Path):
     """Test configuration manager."""
     print("Testing ConfigManager...")
     
     # Use temporary config
-    test_config_path = Path.home() / ".filmbot-test" / "config.json"
-    test_config_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Remove old test config
-    if test_config_path.exists():
-        test_config_path.unlink()
-    
-    config = ConfigManager(test_config_path)
+    config = ConfigManager(config_dir / "config.json")
     
     # Test initial state
     assert not config.is_initialized(), "Should not be initialized"
@@ -47,7 +46,7 @@ def test_config_manager():
     schedule_id = config.add_schedule("sunday", "09:20", 60)
     schedules = config.get_schedules()
     assert len(schedules) == 1
-    assert schedules[0]['day_of_week'] == "sunday"
+    assert schedules[0]['day_of_week'] == 0
     
     # Test device name
     config.set_device_name("TestDevice")
@@ -61,17 +60,35 @@ def test_config_manager():
     return config
 
 
-def test_wizard(app):
+def show_until_closed(widget, auto: bool = False):
+    """Run the shared event loop until a test window is closed.
+
+    Args:
+        widget: Top-level test window (already shown)
+        auto: Close the window automatically after AUTO_CLOSE_MS
+    """
+    loop = QEventLoop()
+    widget.setAttribute(Qt.WA_DeleteOnClose)
+    widget.destroyed.connect(loop.quit)
+    if auto:
+        QTimer.singleShot(AUTO_CLOSE_MS, widget.close)
+    loop.exec()
+
+
+def confirm(title: str, question: str, auto: bool = False) -> bool:
+    """Ask whether to run a test (always yes with --auto)."""
+    if auto:
+        return True
+    reply = QMessageBox.question(None, title, question, QMessageBox.Yes | QMessageBox.No)
+    return reply == QMessageBox.Yes
+
+
+def test_wizard(app, config_dir: Path, auto: bool = False):
     """Test setup wizard."""
     print("Testing SetupWizard...")
     
     # Create test config
-    test_config_path = Path.home() / ".filmbot-test" / "wizard-config.json"
-    test_config_path.parent.mkdir(parents=True, exist_ok=True)
-    if test_config_path.exists():
-        test_config_path.unlink()
-    
-    config = ConfigManager(test_config_path)
+    config = ConfigManager(config_dir / "wizard-config.json")
     wizard = SetupWizard(config)
     
     # Show wizard
@@ -81,18 +98,15 @@ def test_wizard(app):
     print("✓ SetupWizard created successfully")
     print("  Close the wizard window to continue tests...")
     
-    wizard.exec()
+    show_until_closed(wizard, auto)
 
 
-def test_live_view(app):
+def test_live_view(app, config_dir: Path, auto: bool = False):
     """Test live view."""
     print("Testing LiveView...")
     
     # Create test config with data
-    test_config_path = Path.home() / ".filmbot-test" / "live-config.json"
-    test_config_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    config = ConfigManager(test_config_path)
+    config = ConfigManager(config_dir / "live-config.json")
     config.set_initialized(True)
     config.set_drive_config("filmbot-drive:", "TestOrg/Box1")
     config.add_schedule("sunday", "09:20", 60)
@@ -106,18 +120,15 @@ def test_live_view(app):
     print("  Note: Video preview will show error (no /dev/video5)")
     print("  Close the window to continue tests...")
     
-    live_view.exec()
+    show_until_closed(live_view, auto)
 
 
-def test_settings(app):
+def test_settings(app, config_dir: Path, auto: bool = False):
     """Test settings screen."""
     print("Testing SettingsScreen...")
     
     # Create test config with data
-    test_config_path = Path.home() / ".filmbot-test" / "settings-config.json"
-    test_config_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    config = ConfigManager(test_config_path)
+    config = ConfigManager(config_dir / "settings-config.json")
     config.set_initialized(True)
     config.set_drive_config("filmbot-drive:", "TestOrg/Box1")
     config.add_schedule("sunday", "09:20", 60)
@@ -130,53 +141,46 @@ def test_settings(app):
     print("✓ SettingsScreen created successfully")
     print("  Close the window to continue...")
     
-    settings.exec()
+    show_until_closed(settings, auto)
 
 
 def main():
     """Run all tests."""
     print("=== Filmbot UI Test Suite ===\n")
     
+    # --auto: test every screen, closing each window on a timer
+    auto = "--auto" in sys.argv
+    
+    # One throwaway directory holds every test config, so runs start clean
+    # without deleting files one by one and leave nothing behind
+    with tempfile.TemporaryDirectory(prefix="filmbot-test-") as tmp:
+        run_tests(Path(tmp), auto)
+    
+    print("\n=== All Tests Complete ===")
+
+
+def run_tests(config_dir: Path, auto: bool = False):
+    """Run the tests with their configs in config_dir."""
     # Test config manager (no GUI)
-    test_config_manager()
+    test_config_manager(config_dir)
     print()
     
-    # Create Qt application
+    # Create Qt application - one for all windows, each test runs a local
+    # event loop until its window closes
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
     
     # Test wizard
-    reply = QMessageBox.question(
-        None,
-        "Test Wizard",
-        "Test the Setup Wizard?",
-        QMessageBox.Yes | QMessageBox.No
-    )
-    if reply == QMessageBox.Yes:
-        test_wizard(app)
+    if confirm("Test Wizard", "Test the Setup Wizard?", auto):
+        test_wizard(app, config_dir, auto)
     
     # Test live view
-    reply = QMessageBox.question(
-        None,
-        "Test Live View",
-        "Test the Live View screen?",
-        QMessageBox.Yes | QMessageBox.No
-    )
-    if reply == QMessageBox.Yes:
-        test_live_view(app)
+    if confirm("Test Live View", "Test the Live View screen?", auto):
+        test_live_view(app, config_dir, auto)
     
     # Test settings
-    reply = QMessageBox.question(
-        None,
-        "Test Settings",
-        "Test the Settings screen?",
-        QMessageBox.Yes | QMessageBox.No
-    )
-    if reply == QMessageBox.Yes:
-        test_settings(app)
-    
-    print("\n=== All Tests Complete ===")
-    print("Test configurations saved to ~/.filmbot-test/")
+    if confirm("Test Settings", "Test the Settings screen?", auto):
+        test_settings(app, config_dir, auto)
 
 
 if __name__ == "__main__":
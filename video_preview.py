@@ -3,17 +3,29 @@ Video preview widget for Filmbot appliance.
 Displays live feed from ATEM Mini via /dev/video5.
 """
 
+import time
+
 import cv2
 import numpy as np
-from PySide6.QtCore import QThread, Signal, Qt, QTimer
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import QThread, Signal, Qt, QTimer, QSize, QBuffer, QIODevice
+from PySide6.QtGui import QImage, QImageReader, QPixmap
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
+FOURCC_MJPG = cv2.VideoWriter_fourcc('M', 'J', 'P', 'G')
+FOURCC_YUYV = cv2.VideoWriter_fourcc('Y', 'U', 'Y', 'V')
+
+# Capture formats to try, in order: (fourcc, width, height, fps or None)
+FORMAT_PROBE_ORDER = (
+    (FOURCC_MJPG, 1920, 1080, 60),
+    (FOURCC_YUYV, 1920, 1080, None),
+)
+
 
 class VideoThread(QThread):
     """Thread for capturing video frames from ATEM."""
     
-    frame_ready = Signal(np.ndarray)
+    frame_ready = Signal(int)  # index of the frame slot to display
+    image_ready = Signal(QImage)
     error_occurred = Signal(str)
     
     def __init__(self, device_path: str = "/dev/video5", fps: int = 30):
@@ -28,6 +40,85 @@ class VideoThread(QThread):
         self.fps = fps
         self.running = False
         self.capture = None
+
+        # True from emitting a frame until the widget has drawn it
+        self._frame_in_flight = False
+
+        # Two reused BGR frame buffers: the widget draws from one while
+        # retrieve() decodes the next frame into the other
+        self._slots = [None, None]
+        self._next_slot = 0
+
+        # Size and QImage format MJPEG frames are decoded to; set by the
+        # widget (Format_Invalid keeps the decoder's own format)
+        self.display_size = QSize()
+        self.image_format = QImage.Format_Invalid
+    
+    def frame_consumed(self):
+        """Let the thread emit the next frame (called by the GUI after drawing)."""
+        self._frame_in_flight = False
+    
+    def frame(self, slot: int) -> np.ndarray:
+        """Get the BGR frame announced by frame_ready.
+
+        Args:
+            slot: Slot index from frame_ready
+
+        Returns:
+            Frame buffer (valid until frame_consumed() is called)
+        """
+        return self._slots[slot]
+    
+    def _decode_mjpeg(self, data: np.ndarray) -> QImage:
+        """Decode a raw MJPEG frame straight to the display size.
+
+        Args:
+            data: Compressed frame, as returned with CAP_PROP_CONVERT_RGB off
+
+        Returns:
+            Decoded image (null if the frame was corrupt)
+        """
+        buffer = QBuffer()
+        buffer.setData(data.tobytes())
+        buffer.open(QIODevice.ReadOnly)
+
+        # libjpeg scales during decode, so the full-size raster is never built
+        reader = QImageReader(buffer, b"jpeg")
+        size = self.display_size
+        if not size.isEmpty():
+            reader.setScaledSize(reader.size().scaled(size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if self.image_format != QImage.Format_Invalid and not image.isNull():
+            image = image.convertToFormat(self.image_format)
+        return image
+    
+    def _negotiate_format(self):
+        """Set up the open capture in the first format that delivers frames.
+
+        Each format after the first gets a freshly opened device, as
+        switching formats on an open capture is unreliable.
+
+        Returns:
+            FOURCC of the working format, or None (capture is then released)
+        """
+        for i, (fourcc, width, height, fps) in enumerate(FORMAT_PROBE_ORDER):
+            if i:
+                self.capture.release()
+                self.capture = cv2.VideoCapture(self.device_path, cv2.CAP_V4L2)
+
+            self.capture.set(cv2.CAP_PROP_FOURCC, fourcc)
+            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            if fps:
+                self.capture.set(cv2.CAP_PROP_FPS, fps)
+            self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Minimize latency
+
+            # Test frame - grab() is enough to see that frames arrive
+            if self.capture.grab():
+                return fourcc
+
+        self.capture.release()
+        return None
     
     def run(self):
         """Main thread loop - captures and emits frames."""
@@ -47,50 +138,64 @@ class VideoThread(QThread):
                     continue
 
                 # Set capture properties - try MJPEG first, fallback to YUYV
-                self.capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))
-                self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
-                self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-                self.capture.set(cv2.CAP_PROP_FPS, 60)
-                self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Minimize latency
-
-                # Try to read a test frame
-                ret, test_frame = self.capture.read()
-                if not ret:
-                    # Try with YUYV format instead
-                    self.capture.release()
-                    self.capture = cv2.VideoCapture(self.device_path, cv2.CAP_V4L2)
-                    self.capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('Y', 'U', 'Y', 'V'))
-                    self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
-                    self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-                    self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                fourcc = self._negotiate_format()
+                if fourcc is None:
+                    retry_count += 1
+                    self.error_occurred.emit(f"Device opened but no frames (attempt {retry_count}/{max_retries})")
+                    self.msleep(1000)
+                    continue
 
-                    ret, test_frame = self.capture.read()
-                    if not ret:
-                        retry_count += 1
-                        self.error_occurred.emit(f"Device opened but no frames (attempt {retry_count}/{max_retries})")
-                        self.capture.release()
-                        self.msleep(1000)
-                        continue
+                # Success! For MJPEG, have OpenCV hand over the compressed
+                # frames instead of decoding them to full-size BGR; they are
+                # decoded at display size below. YUYV frames stay BGR.
+                if fourcc == FOURCC_MJPG:
+                    self.capture.set(cv2.CAP_PROP_CONVERT_RGB, 0)
 
-                # Success! Start capturing
-                frame_delay = int(1000 / self.fps)  # ms between frames
+                # Start capturing
+                frame_interval = 1.0 / self.fps  # seconds between shown frames
+                next_emit = 0.0
                 consecutive_failures = 0
                 max_consecutive_failures = 10
+                self._frame_in_flight = False
 
+                # grab() blocks until the device has a new frame and only
+                # dequeues it, so the loop keeps the V4L2 queue drained
+                # instead of sleeping while stale frames pile up. Frames are
+                # decoded (retrieve) only when the GUI is ready for one and
+                # the preview rate allows it.
                 while self.running:
-                    ret, frame = self.capture.read()
-
-                    if ret:
-                        self.frame_ready.emit(frame)
-                        consecutive_failures = 0
-                    else:
+                    if not self.capture.grab():
                         consecutive_failures += 1
                         if consecutive_failures >= max_consecutive_failures:
                             self.error_occurred.emit("Too many consecutive frame read failures")
                             break
+                        continue
+                    consecutive_failures = 0
+
+                    now = time.monotonic()
+                    if self._frame_in_flight or now < next_emit:
+                        continue
 
-                    # Throttle to target FPS
-                    self.msleep(frame_delay)
+                    slot = self._next_slot
+                    ret, frame = self.capture.retrieve(self._slots[slot])
+                    if not ret:
+                        continue
+
+                    # Raw MJPEG comes back as a single row of bytes
+                    image = None if frame.ndim == 3 else self._decode_mjpeg(frame)
+                    if image is not None and image.isNull():
+                        continue
+
+                    self._frame_in_flight = True
+                    next_emit = now + frame_interval
+                    if image is None:
+                        # Keep the buffer for reuse (retrieve() replaces it
+                        # only if the frame size changed)
+                        self._slots[slot] = frame
+                        self._next_slot = 1 - slot
+                        self.frame_ready.emit(slot)
+                    else:
+                        self.image_ready.emit(image)
 
                 break  # Exit retry loop
 
@@ -127,9 +232,28 @@ class VideoPreviewWidget(QWidget):
         self.device_path = device_path
         self.video_thread = None
         self.recording = False
+
+        # Reused destination for cv2.resize while the display size is stable,
+        # and a QImage over that same memory
+        self._scaled_buf = None
+        self._scaled_image = None
+
+        # Scaling worked out for the last (frame shape, label size) seen:
+        # target (width, height), or None when frames are shown as-is
+        self._scale_key = None
+        self._target_size = None
+        self._interpolation = cv2.INTER_AREA
+        self._pyramid = []  # pyrDown level buffers applied before the resize
         
         # Create UI
         self.setup_ui()
+
+        # A 16-bit display can't show more than RGB565, so frames are reduced
+        # to it before Qt sees them - half the bytes to copy into the pixmap
+        screen = self.screen()
+        self._rgb565 = screen is not None and screen.depth() <= 16
+        self._display_buf = None
+        self._display_image = None
         
         # Start video capture
         self.start_preview()
@@ -160,7 +284,11 @@ class VideoPreviewWidget(QWidget):
             return
         
         self.video_thread = VideoThread(self.device_path, fps=30)
+        self.video_thread.display_size = self.video_label.size()
+        if self._rgb565:
+            self.video_thread.image_format = QImage.Format_RGB16
         self.video_thread.frame_ready.connect(self.update_frame)
+        self.video_thread.image_ready.connect(self.update_image)
         self.video_thread.error_occurred.connect(self.handle_error)
         self.video_thread.start()
     
@@ -170,33 +298,117 @@ class VideoPreviewWidget(QWidget):
             self.video_thread.stop()
             self.video_thread = None
     
-    def update_frame(self, frame: np.ndarray):
+    def update_frame(self, slot: int):
         """Update the displayed frame.
         
         Args:
-            frame: OpenCV frame (BGR format)
+            slot: Capture thread frame slot holding an OpenCV frame (BGR format)
         """
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if self.video_thread is None:
+            return
+        frame = self.video_thread.frame(slot)
+        if frame is None:
+            return
         
-        # Get widget size for scaling
-        widget_size = self.video_label.size()
+        # Frame and label sizes rarely change; redo the scaling maths only
+        # when they do
+        key = (frame.shape, self.video_label.width(), self.video_label.height())
+        if key != self._scale_key:
+            self._scale_key = key
+            self._plan_scaling(frame.shape)
         
-        # Scale frame to fit widget while maintaining aspect ratio
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
+        # Resize in OpenCV before Qt sees the frame, so only display-sized
+        # pixels are wrapped and copied into the pixmap
+        if self._target_size is not None:
+            # Halve with pyrDown while still at least twice the target size,
+            # then resize the remaining small step
+            for level in self._pyramid:
+                cv2.pyrDown(frame, dst=level)
+                frame = level
+            cv2.resize(frame, self._target_size, dst=self._scaled_buf,
+                       interpolation=self._interpolation)
+            frame = self._scaled_buf
+            qt_image = self._scaled_image
+        else:
+            # Wrap the BGR frame directly - Qt reads BGR, so no per-frame
+            # cvtColor copy is needed
+            h, w, _ = frame.shape
+            qt_image = QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888)
         
-        # Create QImage
-        qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
+        # 16-bit display: pack to RGB565 (OpenCV's BGR565 is Qt's RGB16)
+        if self._display_image is not None:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2BGR565, dst=self._display_buf)
+            qt_image = self._display_image
         
-        # Scale to widget size
-        scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-            widget_size,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        self.video_label.setPixmap(QPixmap.fromImage(qt_image))
         
-        self.video_label.setPixmap(scaled_pixmap)
+        # Ready for the next frame
+        if self.video_thread:
+            self.video_thread.frame_consumed()
+    
+    def _plan_scaling(self, shape):
+        """Work out how frames of a given shape are scaled into the label.
+
+        Fits the frame to the label keeping its aspect ratio, plans pyrDown
+        levels for large reductions and reallocates the output buffers.
+
+        Args:
+            shape: Frame shape (height, width, channels)
+        """
+        h, w, _ = shape
+        scale = min(self.video_label.width() / w, self.video_label.height() / h)
+        target_w = max(1, int(w * scale))
+        target_h = max(1, int(h * scale))
+
+        self._pyramid = []
+        if (target_w, target_h) == (w, h):
+            self._target_size = None
+        else:
+            self._target_size = (target_w, target_h)
+
+            # pyrDown levels while the halved frame still covers the target
+            level_w, level_h = w, h
+            while (level_w + 1) // 2 >= target_w and (level_h + 1) // 2 >= target_h:
+                level_w, level_h = (level_w + 1) // 2, (level_h + 1) // 2
+                self._pyramid.append(np.empty((level_h, level_w, 3), np.uint8))
+
+            shrinking = target_w < level_w or target_h < level_h
+            self._interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR
+
+            if self._scaled_buf is None or self._scaled_buf.shape[:2] != (target_h, target_w):
+                self._scaled_buf = np.empty((target_h, target_w, 3), np.uint8)
+                # Wraps the buffer without copying, so it shows whatever
+                # cv2.resize last wrote there
+                self._scaled_image = QImage(
+                    self._scaled_buf.data, target_w, target_h,
+                    self._scaled_buf.strides[0], QImage.Format_BGR888
+                )
+
+        if self._rgb565 and (self._display_buf is None
+                             or self._display_buf.shape[:2] != (target_h, target_w)):
+            self._display_buf = np.empty((target_h, target_w, 2), np.uint8)
+            self._display_image = QImage(
+                self._display_buf.data, target_w, target_h,
+                self._display_buf.strides[0], QImage.Format_RGB16
+            )
+    
+    def update_image(self, image: QImage):
+        """Update the displayed frame with an image already at display size.
+        
+        Args:
+            image: Frame decoded by the capture thread
+        """
+        self.video_label.setPixmap(QPixmap.fromImage(image))
+        
+        # Ready for the next frame
+        if self.video_thread:
+            self.video_thread.frame_consumed()
+    
+    def resizeEvent(self, event):
+        """Keep the capture thread decoding at the current display size."""
+        super().resizeEvent(event)
+        if self.video_thread:
+            self.video_thread.display_size = self.video_label.size()
     
     def handle_error(self, error_msg: str):
         """Handle video capture errors.
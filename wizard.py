@@ -3,18 +3,107 @@ First-boot setup wizard for Filmbot appliance.
 Guides user through initial configuration.
 """
 
-import subprocess
-from PySide6.QtCore import Qt, Signal, QTime
+import copy
+from functools import lru_cache
+from PySide6.QtCore import (
+    Qt, Signal, QTime, QObject, QRunnable, QThreadPool
+)
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QComboBox, QSpinBox, QTimeEdit, QListWidget,
-    QListWidgetItem, QMessageBox, QTextEdit, QStackedWidget, QCheckBox
+    QListWidgetItem, QMessageBox, QTextEdit, QStackedWidget, QCheckBox,
+    QInputDialog
 )
 from PySide6.QtGui import QFont
 
-from config_manager import ConfigManager
+from config_manager import ConfigManager, DAY_NAMES
 from systemd_manager import SystemdManager
 from device_detector import detect_video_devices, detect_audio_devices
+from rclone_rc import get_rclone_daemon, list_remote_dirs
+from email_notify import SendEmailTask
+
+# Day labels indexed by schedule day_of_week (0 = Sunday)
+DAY_LABELS = tuple(name.capitalize() for name in DAY_NAMES)
+
+
+def _make_font(pixel_size: int, bold: bool = False) -> QFont:
+    """Create a font shared by every widget that uses it.
+
+    Args:
+        pixel_size: Font size in pixels
+        bold: Whether the font is bold
+
+    Returns:
+        Font to pass to setFont
+    """
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+
+# Fonts set with setFont instead of per-widget font-size style sheets
+_TITLE_FONT = _make_font(24, bold=True)
+_LABEL_FONT_BOLD = _make_font(14, bold=True)
+_LARGE_LABEL_FONT_BOLD = _make_font(16, bold=True)
+
+
+@lru_cache(maxsize=None)
+def _button_style(color: str) -> str:
+    """Get button stylesheet.
+
+    Cached per color so every button of a color shares one string.
+
+    Args:
+        color: Button color
+
+    Returns:
+        CSS stylesheet string
+    """
+    return f"""
+        QPushButton {{
+            background-color: {color};
+            color: white;
+            border: none;
+            border-radius: 5px;
+            font-size: 16px;
+            font-weight: bold;
+            padding: 10px;
+        }}
+        QPushButton:pressed {{
+            background-color: {color}dd;
+        }}
+    """
+
+
+class _ApplySchedulesSignals(QObject):
+    """Signals emitted by _ApplySchedulesTask."""
+
+    done = Signal(bool)
+
+
+class _ApplySchedulesTask(QRunnable):
+    """Writes and enables the schedule timers on the thread pool."""
+
+    def __init__(self, schedules):
+        """Initialize apply task.
+
+        Args:
+            schedules: Schedule dictionaries from the config
+        """
+        super().__init__()
+        self.schedules = schedules
+        self.signals = _ApplySchedulesSignals()
+
+    def run(self):
+        """Create the systemd units and report whether all succeeded."""
+        try:
+            systemd_mgr = SystemdManager(dry_run=False)
+            ok = systemd_mgr.create_schedule_services_bulk(self.schedules)
+        except Exception as e:
+            print(f"Error creating schedule services: {e}")
+            ok = False
+        self.signals.done.emit(ok)
 
 
 class WizardPage(QWidget):
@@ -32,6 +121,8 @@ class WizardPage(QWidget):
         """
         super().__init__(parent)
         self.title = title
+        self.back_btn = None
+        self.next_btn = None
         self.setup_base_ui()
     
     def setup_base_ui(self):
@@ -41,7 +132,8 @@ class WizardPage(QWidget):
         
         # Title
         title_label = QLabel(self.title)
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #2196F3;")
+        title_label.setFont(_TITLE_FONT)
+        title_label.setStyleSheet("color: #2196F3;")
         title_label.setAlignment(Qt.AlignCenter)
         self.layout.addWidget(title_label)
     
@@ -55,44 +147,20 @@ class WizardPage(QWidget):
         button_layout = QHBoxLayout()
         
         if show_back:
-            back_btn = QPushButton("← Back")
-            back_btn.setMinimumHeight(50)
-            back_btn.setStyleSheet(self._button_style("#757575"))
-            back_btn.clicked.connect(self.back_requested.emit)
-            button_layout.addWidget(back_btn)
+            self.back_btn = QPushButton("← Back")
+            self.back_btn.setMinimumHeight(50)
+            self.back_btn.setStyleSheet(_button_style("#757575"))
+            self.back_btn.clicked.connect(self.back_requested.emit)
+            button_layout.addWidget(self.back_btn)
         
-        next_btn = QPushButton(next_text)
-        next_btn.setMinimumHeight(50)
-        next_btn.setStyleSheet(self._button_style("#4CAF50"))
-        next_btn.clicked.connect(self.next_requested.emit)
-        button_layout.addWidget(next_btn)
+        self.next_btn = QPushButton(next_text)
+        self.next_btn.setMinimumHeight(50)
+        self.next_btn.setStyleSheet(_button_style("#4CAF50"))
+        self.next_btn.clicked.connect(self.next_requested.emit)
+        button_layout.addWidget(self.next_btn)
         
         self.layout.addLayout(button_layout)
     
-    def _button_style(self, color: str) -> str:
-        """Get button stylesheet.
-        
-        Args:
-            color: Button color
-            
-        Returns:
-            CSS stylesheet string
-        """
-        return f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 10px;
-            }}
-            QPushButton:pressed {{
-                background-color: {color}dd;
-            }}
-        """
-    
     def validate(self) -> bool:
         """Validate page input.
         
@@ -145,7 +213,7 @@ class DevicePage(WizardPage):
 
         # Video device selection
         video_label = QLabel("Video Device:")
-        video_label.setStyleSheet("font-size: 14px; font-weight: bold;")
+        video_label.setFont(_LABEL_FONT_BOLD)
         self.layout.addWidget(video_label)
 
         self.video_combo = QComboBox()
@@ -155,7 +223,7 @@ class DevicePage(WizardPage):
 
         # Audio device selection
         audio_label = QLabel("Audio Device:")
-        audio_label.setStyleSheet("font-size: 14px; font-weight: bold;")
+        audio_label.setFont(_LABEL_FONT_BOLD)
         self.layout.addWidget(audio_label)
 
         self.audio_combo = QComboBox()
@@ -166,8 +234,8 @@ class DevicePage(WizardPage):
         # Detect button
         detect_btn = QPushButton("🔍 Detect Devices")
         detect_btn.setMinimumHeight(40)
-        detect_btn.setStyleSheet(self._button_style("#2196F3"))
-        detect_btn.clicked.connect(self.detect_devices)
+        detect_btn.setStyleSheet(_button_style("#2196F3"))
+        detect_btn.clicked.connect(lambda: self.detect_devices(force=True))
         self.layout.addWidget(detect_btn)
 
         # Status label
@@ -179,24 +247,25 @@ class DevicePage(WizardPage):
         self.layout.addStretch()
         self.add_navigation_buttons()
 
-        # Initial device detection
-        self.detect_devices()
+        # Initial device detection - reuses the last scan unless something
+        # was hotplugged since
+        self.detect_devices(force=False)
 
-    def detect_devices(self):
-        """Detect available devices."""
+    def detect_devices(self, force: bool = True):
+        """Detect available devices.
+
+        Args:
+            force: Rescan even if no device was hotplugged since the last scan
+        """
         self.status_label.setText("Detecting devices...")
 
         # Detect video devices
-        video_devices = detect_video_devices()
-        self.video_combo.clear()
-        for device_path, device_name in video_devices:
-            self.video_combo.addItem(f"{device_name}", device_path)
+        video_devices = detect_video_devices(refresh=force)
+        self._populate_device_combo(self.video_combo, video_devices)
 
         # Detect audio devices
-        audio_devices = detect_audio_devices()
-        self.audio_combo.clear()
-        for device_id, device_name in audio_devices:
-            self.audio_combo.addItem(f"{device_name}", device_id)
+        audio_devices = detect_audio_devices(refresh=force)
+        self._populate_device_combo(self.audio_combo, audio_devices)
 
         # Update status
         self.status_label.setText(
@@ -207,16 +276,33 @@ class DevicePage(WizardPage):
         current_devices = self.config.get_devices()
 
         # Select current video device if it exists
-        for i in range(self.video_combo.count()):
-            if self.video_combo.itemData(i) == current_devices['video_device']:
-                self.video_combo.setCurrentIndex(i)
-                break
+        idx = self.video_combo.findData(current_devices['video_device'])
+        if idx >= 0:
+            self.video_combo.setCurrentIndex(idx)
 
         # Select current audio device if it exists
-        for i in range(self.audio_combo.count()):
-            if self.audio_combo.itemData(i) == current_devices['audio_device']:
-                self.audio_combo.setCurrentIndex(i)
-                break
+        idx = self.audio_combo.findData(current_devices['audio_device'])
+        if idx >= 0:
+            self.audio_combo.setCurrentIndex(idx)
+
+    def _populate_device_combo(self, combo: QComboBox, devices):
+        """Fill a device combo in one batch.
+
+        Args:
+            combo: Combo box to fill
+            devices: List of (device_id, device_name) tuples
+        """
+        # Suppress per-item signals and repaints while filling
+        combo.setUpdatesEnabled(False)
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems([device_name for _, device_name in devices])
+            for i, (device_id, _) in enumerate(devices):
+                combo.setItemData(i, device_id)
+        finally:
+            combo.blockSignals(False)
+            combo.setUpdatesEnabled(True)
 
     def validate(self) -> bool:
         """Validate device selection."""
@@ -244,6 +330,11 @@ class DrivePage(WizardPage):
         super().__init__("Google Drive Setup", parent)
         
         self.config = config
+
+        # Folder browser / connection test state
+        self._browse_busy = False
+        self._test_busy = False
+        self._browse_folder = ""
         
         # Instructions
         instructions = QLabel(
@@ -256,7 +347,7 @@ class DrivePage(WizardPage):
 
         # Remote name
         remote_label = QLabel("rclone Remote Name:")
-        remote_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        remote_label.setFont(_LARGE_LABEL_FONT_BOLD)
         self.layout.addWidget(remote_label)
 
         self.remote_input = QLineEdit()
@@ -268,7 +359,7 @@ class DrivePage(WizardPage):
 
         # Folder path
         folder_label = QLabel("Destination Folder:")
-        folder_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        folder_label.setFont(_LARGE_LABEL_FONT_BOLD)
         self.layout.addWidget(folder_label)
 
         folder_row = QHBoxLayout()
@@ -281,19 +372,7 @@ class DrivePage(WizardPage):
         browse_btn = QPushButton("📁 Browse")
         browse_btn.setMinimumHeight(50)
         browse_btn.setFixedWidth(140)
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:pressed {
-                background-color: #F57C00;
-            }
-        """)
+        browse_btn.setStyleSheet(_button_style("#FF9800"))
         browse_btn.clicked.connect(self.browse_folders)
         folder_row.addWidget(browse_btn)
 
@@ -302,12 +381,15 @@ class DrivePage(WizardPage):
         # Test button
         test_btn = QPushButton("Test Connection")
         test_btn.setMinimumHeight(40)
-        test_btn.setStyleSheet(self._button_style("#2196F3"))
+        test_btn.setStyleSheet(_button_style("#2196F3"))
         test_btn.clicked.connect(self.test_connection)
         self.layout.addWidget(test_btn)
         
         self.layout.addStretch()
         self.add_navigation_buttons()
+
+        # Warm up the rclone daemon while the user fills in the form
+        get_rclone_daemon().start()
     
     def browse_folders(self):
         """Browse Google Drive folders using rclone."""
@@ -317,57 +399,55 @@ class DrivePage(WizardPage):
             QMessageBox.warning(self, "Error", "Please enter a remote name first")
             return
 
-        try:
-            # Get current folder or root
-            current_folder = self.folder_input.text().strip()
-
-            # List directories
-            result = subprocess.run(
-                ['rclone', 'lsd', f"{remote}{current_folder}"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+        # Ignore repeated taps while a listing is still running
+        if self._browse_busy:
+            return
+        self._browse_busy = True
 
-            if result.returncode != 0:
-                QMessageBox.warning(self, "Error", f"Failed to list folders:\n{result.stderr}")
-                return
+        # Get current folder or root
+        self._browse_folder = self.folder_input.text().strip()
 
-            # Parse folder list
-            folders = []
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    # rclone lsd format: "          -1 2024-01-01 12:00:00        -1 FolderName"
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        folder_name = ' '.join(parts[4:])
-                        folders.append(folder_name)
-
-            if not folders:
-                QMessageBox.information(self, "Browse", "No folders found in this location")
-                return
+        # Listed by the rclone daemon, or rclone lsd until it is up
+        list_remote_dirs(remote, self._browse_folder, self._on_browse_listed)
 
-            # Show folder selection dialog
-            from PySide6.QtWidgets import QInputDialog
-            folder, ok = QInputDialog.getItem(
-                self,
-                "Select Folder",
-                "Choose a folder:",
-                folders,
-                0,
-                False
-            )
+    def _on_browse_listed(self, folders, error: str):
+        """Show folder selection once the folders have been listed."""
+        self._browse_busy = False
 
-            if ok and folder:
-                # Append to current path
-                if current_folder:
-                    new_path = f"{current_folder}/{folder}"
-                else:
-                    new_path = folder
-                self.folder_input.setText(new_path)
+        if folders is None:
+            QMessageBox.warning(self, "Error", f"Failed to list folders:\n{error}")
+            return
 
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Browse failed: {str(e)}")
+        self._show_folder_choices(folders)
+
+    def _show_folder_choices(self, folders):
+        """Let the user pick one of the listed folders.
+
+        Args:
+            folders: Folder names found under the current folder
+        """
+        if not folders:
+            QMessageBox.information(self, "Browse", "No folders found in this location")
+            return
+
+        # Show folder selection dialog
+        folder, ok = QInputDialog.getItem(
+            self,
+            "Select Folder",
+            "Choose a folder:",
+            folders,
+            0,
+            False
+        )
+
+        if ok and folder:
+            # Append to current path
+            current_folder = self._browse_folder
+            if current_folder:
+                new_path = f"{current_folder}/{folder}"
+            else:
+                new_path = folder
+            self.folder_input.setText(new_path)
 
     def test_connection(self):
         """Test rclone connection."""
@@ -378,21 +458,22 @@ class DrivePage(WizardPage):
             QMessageBox.warning(self, "Error", "Please enter a remote name")
             return
 
-        try:
-            # Test with rclone lsd
-            result = subprocess.run(
-                ['rclone', 'lsd', f"{remote}{folder}"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+        # Ignore repeated taps while a test is still running
+        if self._test_busy:
+            return
+        self._test_busy = True
 
-            if result.returncode == 0:
-                QMessageBox.information(self, "Success", "Connection test successful!")
-            else:
-                QMessageBox.warning(self, "Error", f"Connection failed:\n{result.stderr}")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Test failed: {str(e)}")
+        # Listed by the rclone daemon, or rclone lsd until it is up
+        list_remote_dirs(remote, folder, self._on_test_listed)
+
+    def _on_test_listed(self, folders, error: str):
+        """Report the result of the connection test."""
+        self._test_busy = False
+
+        if folders is None:
+            QMessageBox.warning(self, "Error", f"Connection failed:\n{error}")
+        else:
+            QMessageBox.information(self, "Success", "Connection test successful!")
     
     def validate(self) -> bool:
         """Validate drive configuration."""
@@ -439,10 +520,7 @@ class SchedulePage(WizardPage):
         day_layout = QHBoxLayout()
         day_layout.addWidget(QLabel("Day:"))
         self.day_combo = QComboBox()
-        self.day_combo.addItems([
-            "Sunday", "Monday", "Tuesday", "Wednesday",
-            "Thursday", "Friday", "Saturday"
-        ])
+        self.day_combo.addItems(DAY_LABELS)
         self.day_combo.setMinimumHeight(40)
         day_layout.addWidget(self.day_combo)
         form_layout.addLayout(day_layout)
@@ -474,13 +552,13 @@ class SchedulePage(WizardPage):
 
         add_btn = QPushButton("+ Add Schedule")
         add_btn.setMinimumHeight(40)
-        add_btn.setStyleSheet(self._button_style("#4CAF50"))
+        add_btn.setStyleSheet(_button_style("#4CAF50"))
         add_btn.clicked.connect(self.add_schedule)
         button_layout.addWidget(add_btn)
 
         remove_btn = QPushButton("- Remove Selected")
         remove_btn.setMinimumHeight(40)
-        remove_btn.setStyleSheet(self._button_style("#f44336"))
+        remove_btn.setStyleSheet(_button_style("#f44336"))
         remove_btn.clicked.connect(self.remove_schedule)
         button_layout.addWidget(remove_btn)
 
@@ -494,37 +572,46 @@ class SchedulePage(WizardPage):
 
     def load_schedules(self):
         """Load schedules from config."""
-        self.schedule_list.clear()
-        for schedule in self.config.get_schedules():
-            self.add_schedule_to_list(schedule)
-
-    def add_schedule_to_list(self, schedule: dict):
-        """Add a schedule to the list widget."""
-        day = schedule['day_of_week'].capitalize()
-        time = schedule['start_time']
-        duration = schedule['duration_minutes']
-        text = f"{day} {time} - {duration} minutes"
-
-        item = QListWidgetItem(text)
-        item.setData(Qt.UserRole, schedule['id'])
+        # Suppress per-item signals and repaints while refilling
+        self.schedule_list.setUpdatesEnabled(False)
+        self.schedule_list.blockSignals(True)
+        try:
+            self.schedule_list.clear()
+            for schedule in self.config.get_schedules():
+                self._add_row(
+                    schedule['id'],
+                    schedule['day_of_week'],
+                    schedule['start_time'],
+                    schedule['duration_minutes']
+                )
+        finally:
+            self.schedule_list.blockSignals(False)
+            self.schedule_list.setUpdatesEnabled(True)
+
+    def _add_row(self, schedule_id: str, day: int, time: str, duration: int):
+        """Add a schedule to the list widget.
+
+        Args:
+            schedule_id: Schedule ID
+            day: Day index (0 = Sunday)
+            time: Start time in HH:MM format
+            duration: Duration in minutes
+        """
+        item = QListWidgetItem(f"{DAY_LABELS[day]} {time} - {duration} minutes")
+        item.setData(Qt.UserRole, schedule_id)
         self.schedule_list.addItem(item)
 
     def add_schedule(self):
         """Add a new schedule."""
-        day = self.day_combo.currentText().lower()
+        # Combo order matches the stored day index (0 = Sunday)
+        day = self.day_combo.currentIndex()
         time = self.time_edit.time().toString("HH:mm")
         duration = self.duration_spin.value()
 
         schedule_id = self.config.add_schedule(day, time, duration)
 
         # Add to list
-        schedule = {
-            'id': schedule_id,
-            'day_of_week': day,
-            'start_time': time,
-            'duration_minutes': duration
-        }
-        self.add_schedule_to_list(schedule)
+        self._add_row(schedule_id, day, time, duration)
 
     def remove_schedule(self):
         """Remove selected schedule."""
@@ -559,6 +646,7 @@ class EmailAlertsPage(WizardPage):
         super().__init__("Email Alerts (Optional)", parent)
 
         self.config = config
+        self._email_task = None  # test email in flight
 
         # Description
         desc = QLabel(
@@ -571,7 +659,7 @@ class EmailAlertsPage(WizardPage):
 
         # Enable checkbox
         self.enable_checkbox = QCheckBox("Enable Email Alerts")
-        self.enable_checkbox.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.enable_checkbox.setFont(_LABEL_FONT_BOLD)
         self.enable_checkbox.toggled.connect(self.toggle_fields)
         self.layout.addWidget(self.enable_checkbox)
 
@@ -617,11 +705,11 @@ class EmailAlertsPage(WizardPage):
         self.layout.addWidget(self.password_input)
 
         # Test button
-        test_btn = QPushButton("Test Email Configuration")
-        test_btn.setMinimumHeight(45)
-        test_btn.setStyleSheet(self._button_style("#2196F3"))
-        test_btn.clicked.connect(self.test_email)
-        self.layout.addWidget(test_btn)
+        self.test_btn = QPushButton("Test Email Configuration")
+        self.test_btn.setMinimumHeight(45)
+        self.test_btn.setStyleSheet(_button_style("#2196F3"))
+        self.test_btn.clicked.connect(self.test_email)
+        self.layout.addWidget(self.test_btn)
 
         self.layout.addStretch()
         self.add_navigation_buttons(show_back=True, next_text="Next")
@@ -657,30 +745,39 @@ class EmailAlertsPage(WizardPage):
             smtp_password=password
         )
 
-        # Test sending
-        try:
-            from email_notify import EmailNotifier
-            notifier = EmailNotifier()
-            success = notifier.send_email(
-                subject="Test Email from Filmbot",
-                body="This is a test email. If you receive this, email alerts are working!",
-                priority="info"
-            )
+        # Test sending - SMTP + TLS runs on the thread pool, not the UI thread
+        self.test_btn.setEnabled(False)
 
-            if success:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Test email sent to {email_to}!\n\nCheck your inbox (and spam folder)."
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Failed",
-                    "Failed to send test email. Check your credentials and try again."
-                )
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error testing email: {str(e)}")
+        task = SendEmailTask(
+            subject="Test Email from Filmbot",
+            body="This is a test email. If you receive this, email alerts are working!",
+            priority="info"
+        )
+        task.signals.done.connect(
+            lambda success, error: self._on_test_email_done(success, error, email_to)
+        )
+        self._email_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_test_email_done(self, success: bool, error: str, email_to: str):
+        """Show the result of a test email sent from the thread pool."""
+        self._email_task = None
+        self.test_btn.setEnabled(True)
+
+        if error:
+            QMessageBox.critical(self, "Error", f"Error testing email: {error}")
+        elif success:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"Test email sent to {email_to}!\n\nCheck your inbox (and spam folder)."
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Failed",
+                "Failed to send test email. Check your credentials and try again."
+            )
 
     def validate(self) -> bool:
         """Validate and save email configuration."""
@@ -716,10 +813,13 @@ class EmailAlertsPage(WizardPage):
 class FinishPage(WizardPage):
     """Finish page - apply configuration."""
 
+    configuration_applied = Signal()
+
     def __init__(self, config: ConfigManager, parent=None):
         super().__init__("Setup Complete", parent)
 
         self.config = config
+        self._apply_task = None  # systemd timers being created
 
         # Summary
         summary = QLabel(
@@ -741,43 +841,75 @@ class FinishPage(WizardPage):
         self.layout.addStretch()
         self.add_navigation_buttons(show_back=True, next_text="Finish")
 
-    def apply_configuration(self) -> bool:
+    def apply_configuration(self):
         """Apply configuration and create systemd services.
 
-        Returns:
-            True if successful, False otherwise
+        The unit files are written and enabled on the thread pool;
+        configuration_applied is emitted once that has finished.
         """
-        self.status_text.clear()
-        self.log("Applying configuration...")
+        # Ignore repeated taps while the timers are being created
+        if self._apply_task is not None:
+            return
+
+        lines = ["Applying configuration..."]
 
         # Update sync script with new Drive path
         drive_config = self.config.get_drive_config()
-        self.log(f"Drive: {drive_config['remote']}{drive_config['folder']}")
+        lines.append(f"Drive: {drive_config['remote']}{drive_config['folder']}")
 
         # Create systemd services for schedules
-        systemd_mgr = SystemdManager(dry_run=False)
-
         schedules = self.config.get_schedules()
-        self.log(f"\nCreating {len(schedules)} recording schedule(s)...")
+        lines.append(f"\nCreating {len(schedules)} recording schedule(s)...")
 
         for schedule in schedules:
-            self.log(f"  - {schedule['day_of_week']} {schedule['start_time']} ({schedule['duration_minutes']} min)")
-            systemd_mgr.create_schedule_services(schedule)
+            day = DAY_NAMES[schedule['day_of_week']]
+            lines.append(f"  - {day} {schedule['start_time']} ({schedule['duration_minutes']} min)")
+
+        # One document layout for the whole summary instead of one per line
+        self.status_text.setPlainText("\n".join(lines))
+
+        # One daemon-reload for all schedules instead of one per schedule.
+        # The worker gets its own copy; the config stays editable meanwhile.
+        task = _ApplySchedulesTask(copy.deepcopy(schedules))
+        task.signals.done.connect(self._on_schedules_applied)
+        self._apply_task = task
+        self._set_navigation_enabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_schedules_applied(self, ok: bool):
+        """Finish applying once the systemd timers have been created."""
+        self._apply_task = None
+        self._set_navigation_enabled(True)
+
+        if not ok:
+            # Leave setup unfinished so the timers can be created again
+            self.log("\n⚠ Some systemd timers could not be created\n\n"
+                     "Click 'Finish' to try again.")
+            return
 
         # Mark as initialized
         self.config.set_initialized(True)
-        self.log("\n✓ Configuration saved!")
-        self.log("\n✓ Systemd timers created!")
+        self.log("\n✓ Configuration saved!\n\n✓ Systemd timers created!")
 
-        return True
+        self.configuration_applied.emit()
+
+    def _set_navigation_enabled(self, enabled: bool):
+        """Enable or disable the Back and Finish buttons."""
+        self.back_btn.setEnabled(enabled)
+        self.next_btn.setEnabled(enabled)
 
     def log(self, message: str):
         """Add message to status log."""
         self.status_text.append(message)
 
     def validate(self) -> bool:
-        """Apply configuration before finishing."""
-        return self.apply_configuration()
+        """Start applying configuration before finishing.
+
+        Returns:
+            False; configuration_applied is emitted once applying is done
+        """
+        self.apply_configuration()
+        return False
 
 
 class SetupWizard(QWidget):
@@ -790,40 +922,28 @@ class SetupWizard(QWidget):
 
         self.config = config
 
-        # Create pages
+        # Create pages - only the welcome page up front; the rest are built
+        # the first time the user moves on to them
         self.pages = QStackedWidget()
 
         self.welcome_page = WelcomePage()
-        self.device_page = DevicePage(config)
-        self.drive_page = DrivePage(config)
-        self.schedule_page = SchedulePage(config)
-        self.email_alerts_page = EmailAlertsPage(config)
-        self.finish_page = FinishPage(config)
-
         self.pages.addWidget(self.welcome_page)
-        self.pages.addWidget(self.device_page)
-        self.pages.addWidget(self.drive_page)
-        self.pages.addWidget(self.schedule_page)
-        self.pages.addWidget(self.email_alerts_page)
-        self.pages.addWidget(self.finish_page)
-
-        # Connect signals
-        self.welcome_page.next_requested.connect(lambda: self.next_page())
-
-        self.device_page.next_requested.connect(lambda: self.next_page())
-        self.device_page.back_requested.connect(lambda: self.prev_page())
-
-        self.drive_page.next_requested.connect(lambda: self.next_page())
-        self.drive_page.back_requested.connect(lambda: self.prev_page())
-
-        self.schedule_page.next_requested.connect(lambda: self.next_page())
-        self.schedule_page.back_requested.connect(lambda: self.prev_page())
-
-        self.email_alerts_page.next_requested.connect(lambda: self.next_page())
-        self.email_alerts_page.back_requested.connect(lambda: self.prev_page())
-
-        self.finish_page.next_requested.connect(self.finish)
-        self.finish_page.back_requested.connect(lambda: self.prev_page())
+        self.welcome_page.next_requested.connect(self.next_page)
+
+        self.device_page = None
+        self.drive_page = None
+        self.schedule_page = None
+        self.email_alerts_page = None
+        self.finish_page = None
+
+        # (attribute name, factory) for each page after the welcome page
+        self._page_factories = (
+            ('device_page', lambda: DevicePage(config)),
+            ('drive_page', lambda: DrivePage(config)),
+            ('schedule_page', lambda: SchedulePage(config)),
+            ('email_alerts_page', lambda: EmailAlertsPage(config)),
+            ('finish_page', lambda: FinishPage(config)),
+        )
 
         # Layout
         layout = QVBoxLayout(self)
@@ -838,10 +958,32 @@ class SetupWizard(QWidget):
         if hasattr(current_widget, 'validate') and not current_widget.validate():
             return
 
-        # Move to next page
+        # Move to next page, building it on first visit
         current_index = self.pages.currentIndex()
-        if current_index < self.pages.count() - 1:
-            self.pages.setCurrentIndex(current_index + 1)
+        if current_index == self.pages.count() - 1:
+            if current_index >= len(self._page_factories):
+                return
+            self._build_page(current_index)
+        self.pages.setCurrentIndex(current_index + 1)
+
+    def _build_page(self, index: int):
+        """Create a page and add it to the end of the stack.
+
+        Args:
+            index: Index into the page factories
+        """
+        name, factory = self._page_factories[index]
+        page = factory()
+        setattr(self, name, page)
+        self.pages.addWidget(page)
+
+        # Connect signals
+        if page is self.finish_page:
+            page.next_requested.connect(self.finish)
+            page.configuration_applied.connect(self.setup_complete.emit)
+        else:
+            page.next_requested.connect(self.next_page)
+        page.back_requested.connect(self.prev_page)
 
     def prev_page(self):
         """Go to previous page."""
@@ -850,7 +992,10 @@ class SetupWizard(QWidget):
             self.pages.setCurrentIndex(current_index - 1)
 
     def finish(self):
-        """Finish wizard."""
-        if self.finish_page.validate():
-            self.setup_complete.emit()
+        """Finish wizard.
+
+        setup_complete is emitted once the finish page has applied the
+        configuration.
+        """
+        self.finish_page.apply_configuration()
 